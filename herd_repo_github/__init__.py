@@ -4,6 +4,7 @@ Herd repository operations adapter for GitHub.
 Part of The Herd ecosystem: https://github.com/herd-ag/herd-core
 """
 
-from herd_repo_github.adapter import GitHubRepoAdapter
+from herd_repo_github.adapter import BatchError, GitHubRepoAdapter, PRCreateSpec
+from herd_repo_github.rate_limit import RateLimiter
 
-__all__ = ["GitHubRepoAdapter"]
+__all__ = ["BatchError", "GitHubRepoAdapter", "PRCreateSpec", "RateLimiter"]
@@ -2,26 +2,355 @@
 
 from __future__ import annotations
 
+import asyncio
+import configparser
+import contextlib
+import importlib.util
 import json
+import os
+import re
+import shutil
 import subprocess
+import threading
+import time
+import weakref
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from herd_core.types import CommitInfo, PRRecord
 
+from herd_repo_github.rate_limit import RateLimiter, decode_output
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional direct API access
+    httpx = None
+
+# Pull request fields requested through GraphQL; names match `gh pr view --json`
+_PR_GRAPHQL_FIELDS = (
+    "number title body state headRefName baseRefName url"
+    " additions deletions changedFiles mergedAt closedAt"
+)
+
+# orjson parses the bytes gh writes directly and is several times faster than
+# the stdlib; its JSONDecodeError subclasses json.JSONDecodeError.
+_json_loads: Callable[[str | bytes], Any] = orjson.loads if orjson else json.loads
+
+# Absolute executable paths, resolved once at import so each spawn skips the
+# PATH search. Falls back to the bare name (and a normal lookup) if not found.
+_GIT = shutil.which("git") or "git"
+_GH = shutil.which("gh") or "gh"
+
+_GIT_REMOTE_GET_URL = ("remote", "get-url", "origin")
+
+# owner/name after the GitHub host (":" for scp-style SSH, "/" otherwise, with
+# an optional port), ignoring a trailing ".git", "/" and anything after
+# whitespace. The host must start the URL or follow "@", "/" or "." so that
+# ssh.github.com matches but lookalikes such as notgithub.com do not.
+_REMOTE_RE = re.compile(
+    r"(?:^|[@/.])github\.com(?::\d+)?[:/]"
+    r"(?P<owner>[^/\s]+)/(?P<name>[^/\s]+?)(?:\.git)?/?(?:\s|$)"
+)
+
+# Skip optional lock files (git status index refresh etc.) and never block on
+# an interactive credential prompt.
+_GIT_ENV_OVERRIDES = {"GIT_OPTIONAL_LOCKS": "0", "GIT_TERMINAL_PROMPT": "0"}
+
+
+def _git_base(repo_root: str) -> tuple[str, ...]:
+    """Build the argv prefix for running git against ``repo_root``.
+
+    git is spawned with an absolute executable, no cwd (``-C`` instead) and
+    ``close_fds=False``, which lets CPython launch it with posix_spawn rather
+    than fork+exec, whose cost grows with the parent's memory. Adding
+    ``preexec_fn``, ``pass_fds``, ``start_new_session``, ``cwd`` etc. to a git
+    call silently falls back to fork+exec.
+
+    With ``close_fds=False`` the child inherits every inheritable fd. fds
+    Python itself creates are non-inheritable (PEP 446), but ones opened by C
+    extensions or inherited by this process may not be, and git will keep
+    those open for its lifetime.
+    """
+    return (_GIT, "--no-pager", "-C", repo_root)
+
+
+def _git_env() -> dict[str, str]:
+    """Build the environment for git subprocesses."""
+    return {**os.environ, **_GIT_ENV_OVERRIDES}
+
+
+def _parse_remote_url(remote_url: str) -> tuple[str, str] | None:
+    """Extract (owner, name) from a GitHub remote URL.
+
+    Handles URLs like:
+    - https://github.com/owner/repo.git
+    - git@github.com:owner/repo.git
+    - origin  git@github.com:owner/repo.git (fetch)  (``git remote -v`` line)
+
+    Returns:
+        (owner, name), or None if the URL does not point at a GitHub repo.
+    """
+    match = _REMOTE_RE.search(remote_url)
+    if match is None:
+        return None
+    return match["owner"], match["name"]
+
+
+def _origin_url_from_config(config_path: Path) -> str | None:
+    """Read ``remote.origin.url`` straight from a repository's config file.
+
+    configparser only approximates git-config syntax, so anything it could
+    misread is left to ``git remote get-url`` instead.
+
+    Returns:
+        The URL, or None if the file is missing or unreadable, uses
+        ``[include]``/``[url]`` sections (includes and ``insteadOf`` rewrites
+        that only git resolves), or the value is quoted, escaped or carries
+        an inline comment.
+    """
+    if not config_path.is_file():
+        return None
+
+    parser = configparser.ConfigParser(strict=False, interpolation=None)
+    try:
+        parser.read(config_path, encoding="utf-8")
+    except (configparser.Error, UnicodeDecodeError):
+        return None
+
+    if any(section.startswith(("include", "url ")) for section in parser.sections()):
+        return None
+    url = parser.get('remote "origin"', "url", fallback=None)
+    if url is None or any(char in url for char in '"\\;#'):
+        return None
+    return url
+
+
+# (owner, name) per repository root. Only successful lookups are kept, so a
+# remote added after the first lookup (e.g. right after git init) is found.
+_remote_repo_cache: dict[str, tuple[str, str]] = {}
+
+
+def _remote_repo_info(repo_root: str) -> tuple[str, str] | None:
+    """Look up (owner, name) from the repository's origin remote.
+
+    Reads ``.git/config`` directly when possible and only execs git as a
+    fallback. The remote does not change once set, so successful lookups are
+    cached per resolved repository root (a relative root names a different
+    repository from each working directory).
+
+    Returns:
+        (owner, name), or None if origin is missing or not a GitHub URL.
+    """
+    key = os.path.realpath(repo_root)
+    cached = _remote_repo_cache.get(key)
+    if cached is not None:
+        return cached
+
+    remote_url = _origin_url_from_config(Path(repo_root) / ".git" / "config")
+    if remote_url is None:
+        try:
+            result = subprocess.run(
+                (*_git_base(repo_root), *_GIT_REMOTE_GET_URL),
+                env=_git_env(),
+                close_fds=False,
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+        except subprocess.CalledProcessError:
+            return None
+        remote_url = result.stdout
+
+    repo_info = _parse_remote_url(remote_url)
+    if repo_info is not None:
+        _remote_repo_cache[key] = repo_info
+    return repo_info
+
+
+class _GitSession:
+    """Long-running ``git cat-file --batch-check`` process for object lookups.
+
+    Resolving a revision through the session costs one pipe round-trip
+    instead of a fork+exec of ``git rev-parse``. Sessions are not thread-safe;
+    the adapter keeps one per thread.
+    """
+
+    _ARGV = ("cat-file", "--batch-check=%(objectname) %(objecttype)")
+
+    def __init__(self, git_base: tuple[str, ...], env: dict[str, str]) -> None:
+        self._proc = subprocess.Popen(
+            (*git_base, *self._ARGV),
+            env=env,
+            close_fds=False,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+
+    @property
+    def alive(self) -> bool:
+        """Whether the underlying git process is still running."""
+        return self._proc.poll() is None
+
+    def resolve(self, rev: str) -> str | None:
+        """Resolve a revision to an object name.
+
+        Args:
+            rev: Any revision expression (branch, tag, SHA, ...).
+
+        Returns:
+            Full object name, or None if the revision does not exist.
+
+        Raises:
+            ValueError: If ``rev`` contains a newline or NUL, which would break
+                the one-line-per-request framing.
+            RuntimeError: If the git process has exited or its reply does not
+                match the request; the process is killed in the latter case.
+        """
+        if "\n" in rev or "\0" in rev:
+            raise ValueError(f"Cannot look up revision {rev!r} through a session")
+        assert self._proc.stdin is not None and self._proc.stdout is not None
+        request = rev.encode()
+        try:
+            self._proc.stdin.write(request + b"\n")
+            self._proc.stdin.flush()
+            line = self._proc.stdout.readline()
+        except OSError as e:
+            raise RuntimeError(f"git cat-file session failed: {e}") from e
+        if not line:
+            raise RuntimeError("git cat-file session terminated unexpectedly")
+
+        # "<sha> <type>" on success, "<rev> missing" / "<rev> ambiguous" otherwise
+        object_name, _, object_type = line.rstrip(b"\n").rpartition(b" ")
+        if object_type in (b"missing", b"ambiguous"):
+            if object_name != request:
+                # Out of step with git; every later answer would be wrong
+                self._proc.kill()
+                raise RuntimeError(f"git cat-file session answered for {object_name!r}")
+            return None
+        return object_name.decode()
+
+    def close(self) -> None:
+        """Terminate the git process."""
+        if self._proc.stdin is not None:
+            self._proc.stdin.close()
+        try:
+            self._proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self._proc.kill()
+            self._proc.wait()
+        if self._proc.stdout is not None:
+            self._proc.stdout.close()
+
+
+def _close_sessions(
+    sessions: dict[threading.Thread, _GitSession], lock: threading.Lock
+) -> None:
+    """Terminate and forget every session in ``sessions``.
+
+    Module-level so the adapter's finalizer can call it without keeping the
+    adapter alive.
+    """
+    with lock:
+        closing = list(sessions.values())
+        sessions.clear()
+    for session in closing:
+        session.close()
+
+
+def _gh_resource(args: list[str]) -> str:
+    """Name the GitHub rate-limit resource a gh command spends.
+
+    ``gh pr`` subcommands and ``gh api graphql`` use the GraphQL API; other
+    ``gh api`` calls hit the REST (``core``) API.
+    """
+    if args[1] == "pr" or args[1:3] == ["api", "graphql"]:
+        return "graphql"
+    return "core"
+
+
+_GITHUB_API_URL = "https://api.github.com"
+
+
+def _http_client(token: str) -> httpx.Client:
+    """Build a keep-alive GitHub API client (HTTP/2 when h2 is installed)."""
+    return httpx.Client(
+        base_url=_GITHUB_API_URL,
+        headers={
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/vnd.github+json",
+            "X-GitHub-Api-Version": "2022-11-28",
+        },
+        http2=importlib.util.find_spec("h2") is not None,
+        timeout=30.0,
+    )
+
+
+class BatchError(RuntimeError):
+    """A batch GraphQL mutation that failed after some operations took effect.
+
+    Attributes:
+        results: One entry per requested PR, in request order: the PR
+            number if its operation succeeded, otherwise None.
+    """
+
+    def __init__(self, message: str, results: list[str | None]) -> None:
+        super().__init__(message)
+        self.results = results
+
+
+@dataclass(frozen=True)
+class PRCreateSpec:
+    """A pull request to open with ``GitHubRepoAdapter.create_prs``."""
+
+    title: str
+    body: str
+    head: str
+    base: str = "main"
+
 
 class GitHubRepoAdapter:
     """GitHub implementation of the RepoAdapter protocol.
 
     Uses git CLI for repository operations and gh CLI for pull requests.
+    With a GitHub token and httpx available, single-PR reads, merges and
+    comments call the REST API directly over a pooled connection instead.
+    Object lookups go through a persistent per-thread ``git cat-file``
+    process; call ``close()``, or use the adapter as a context manager, to
+    shut those and the connection down. Sessions left open are closed when
+    the adapter is garbage collected or the interpreter exits.
     """
 
+    # Static subcommand argv, built once instead of per call; each follows
+    # the per-instance ``git --no-pager -C <repo_root>`` prefix
+    _GIT_BRANCH = ("branch",)
+    _GIT_PUSH = ("push", "-u", "origin")
+    _GIT_REV_PARSE = ("rev-parse", "--verify", "--quiet")
+    _GIT_WORKTREE_ADD = ("worktree", "add")
+    _GIT_WORKTREE_REMOVE = ("worktree", "remove")
+    # Format: %H (hash), %an (author), %ai (ISO date), %s (subject), NUL-separated;
+    # -z also ends each record with NUL, so output is a flat stream of fields
+    _GIT_LOG = ("log", "-z", "--format=%H%x00%an%x00%ai%x00%s")
+    _GIT_LOG_FIELDS = 4
+
     def __init__(
         self,
         repo_root: str,
         owner: str = "",
         name: str = "",
+        *,
+        pr_cache_ttl: float = 180.0,
+        rate_limiter: RateLimiter | None = None,
+        token: str | None = None,
     ) -> None:
         """Initialize the GitHub repository adapter.
 
@@ -29,10 +358,36 @@ class GitHubRepoAdapter:
             repo_root: Path to repository root.
             owner: Repository owner (e.g., "dbt-conceptual"). Auto-detected if not provided.
             name: Repository name (e.g., "dbt-conceptual"). Auto-detected if not provided.
+            pr_cache_ttl: Seconds a fetched PR is served from cache. 0 disables caching.
+            rate_limiter: Limiter pacing gh calls. Share one between adapters
+                using the same GitHub credentials. A private one is created
+                if not provided.
+            token: GitHub token for calling the REST API directly over a
+                pooled connection. Defaults to GH_TOKEN/GITHUB_TOKEN. Without
+                a token, or without the ``http`` extra installed, PR
+                operations go through the gh CLI.
         """
         self.repo_root = Path(repo_root)
+        # Converted once; reused for every git -C and gh cwd
+        self._repo_root_str = str(self.repo_root)
+        # -C replaces cwd= (one less chdir in the child); env is built once
+        self._git_base = _git_base(self._repo_root_str)
+        self._git_env = _git_env()
         self.owner = owner
         self.name = name
+        self.pr_cache_ttl = pr_cache_ttl
+        self._pr_cache: dict[str, tuple[float, PRRecord]] = {}
+        self._repo_node_id: str | None = None
+        self._rate_limiter = rate_limiter or RateLimiter()
+        token = token or os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN")
+        # The client (transport, CA bundle) is only built on the first API call
+        self._token = token if token and httpx is not None else None
+        self._http: httpx.Client | None = None
+        self._http_lock = threading.Lock()
+        self._local = threading.local()
+        self._sessions: dict[threading.Thread, _GitSession] = {}
+        self._sessions_lock = threading.Lock()
+        weakref.finalize(self, _close_sessions, self._sessions, self._sessions_lock)
 
         # Auto-detect owner/name from git remote if not provided
         if not owner or not name:
@@ -40,32 +395,59 @@ class GitHubRepoAdapter:
 
     def _detect_repo_info(self) -> None:
         """Auto-detect repository owner and name from git remote."""
+        repo_info = _remote_repo_info(self._repo_root_str)
+        if repo_info is not None:
+            self.owner, self.name = repo_info
+
+    def _git_session(self) -> _GitSession:
+        """Return this thread's git session, starting one if needed."""
+        session: _GitSession | None = getattr(self._local, "session", None)
+        if session is None or not session.alive:
+            session = _GitSession(self._git_base, self._git_env)
+            self._local.session = session
+            current = threading.current_thread()
+            with self._sessions_lock:
+                # Reap this thread's dead session and those of finished threads
+                stale = [
+                    self._sessions.pop(thread)
+                    for thread in list(self._sessions)
+                    if thread is current or not thread.is_alive()
+                ]
+                self._sessions[current] = session
+            for old in stale:
+                old.close()
+        return session
+
+    def _rev_exists(self, rev: str) -> bool:
+        """Check whether a revision resolves to an object in the repository."""
         try:
+            return self._git_session().resolve(rev) is not None
+        except (OSError, RuntimeError, ValueError):
+            # Session could not be started, died mid-request or cannot frame
+            # this rev; fall back to exec
             result = subprocess.run(
-                ["git", "remote", "get-url", "origin"],
-                cwd=str(self.repo_root),
+                (*self._git_base, *self._GIT_REV_PARSE, rev),
+                env=self._git_env,
+                close_fds=False,
                 capture_output=True,
                 text=True,
-                check=True,
             )
-            remote_url = result.stdout.strip()
-
-            # Parse URLs like:
-            # - https://github.com/owner/repo.git
-            # - git@github.com:owner/repo.git
-            if "github.com" in remote_url:
-                if remote_url.startswith("git@"):
-                    # git@github.com:owner/repo.git
-                    parts = remote_url.split(":")[-1].replace(".git", "").split("/")
-                else:
-                    # https://github.com/owner/repo.git
-                    parts = remote_url.replace(".git", "").split("/")[-2:]
-
-                if len(parts) == 2:
-                    self.owner = parts[0]
-                    self.name = parts[1]
-        except subprocess.CalledProcessError:
-            pass
+            return result.returncode == 0
+
+    def close(self) -> None:
+        """Shut down persistent git processes and HTTP connections."""
+        _close_sessions(self._sessions, self._sessions_lock)
+        self._local = threading.local()
+        with self._http_lock:
+            http, self._http = self._http, None
+        if http is not None:
+            http.close()
+
+    def __enter__(self) -> GitHubRepoAdapter:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
     def create_branch(self, name: str, *, base: str = "main") -> str:
         """Create a new branch from base.
@@ -82,8 +464,9 @@ class GitHubRepoAdapter:
         """
         try:
             subprocess.run(
-                ["git", "branch", name, base],
-                cwd=str(self.repo_root),
+                (*self._git_base, *self._GIT_BRANCH, name, base),
+                env=self._git_env,
+                close_fds=False,
                 check=True,
                 capture_output=True,
                 text=True,
@@ -92,12 +475,17 @@ class GitHubRepoAdapter:
         except subprocess.CalledProcessError as e:
             raise RuntimeError(f"Failed to create branch {name}: {e.stderr}") from e
 
-    def create_worktree(self, branch: str, path: str) -> str:
+    def create_worktree(
+        self, branch: str, path: str, *, reset_if_exists: bool = False
+    ) -> str:
         """Create a git worktree for isolated agent work.
 
         Args:
             branch: Branch name (created if it doesn't exist).
             path: Filesystem path for the worktree.
+            reset_if_exists: Reset an existing branch to HEAD instead of
+                checking it out as-is. Skips the existence check, so the
+                worktree is created with a single git call.
 
         Returns:
             Absolute path to the created worktree.
@@ -108,32 +496,24 @@ class GitHubRepoAdapter:
         worktree_path = Path(path).resolve()
 
         try:
-            # Check if branch exists
-            branch_check = subprocess.run(
-                ["git", "rev-parse", "--verify", branch],
-                cwd=str(self.repo_root),
-                capture_output=True,
-                text=True,
-            )
-
-            if branch_check.returncode == 0:
+            if reset_if_exists:
+                # Create the branch, or reset it if it exists, in the same call
+                worktree_args = ("-B", branch, str(worktree_path))
+            elif self._rev_exists(branch):
                 # Branch exists, create worktree from it
-                subprocess.run(
-                    ["git", "worktree", "add", str(worktree_path), branch],
-                    cwd=str(self.repo_root),
-                    check=True,
-                    capture_output=True,
-                    text=True,
-                )
+                worktree_args = (str(worktree_path), branch)
             else:
                 # Branch doesn't exist, create it with worktree
-                subprocess.run(
-                    ["git", "worktree", "add", str(worktree_path), "-b", branch],
-                    cwd=str(self.repo_root),
-                    check=True,
-                    capture_output=True,
-                    text=True,
-                )
+                worktree_args = ("-b", branch, str(worktree_path))
+
+            subprocess.run(
+                (*self._git_base, *self._GIT_WORKTREE_ADD, *worktree_args),
+                env=self._git_env,
+                close_fds=False,
+                check=True,
+                capture_output=True,
+                text=True,
+            )
 
             return str(worktree_path)
         except subprocess.CalledProcessError as e:
@@ -152,8 +532,9 @@ class GitHubRepoAdapter:
         """
         try:
             subprocess.run(
-                ["git", "worktree", "remove", path],
-                cwd=str(self.repo_root),
+                (*self._git_base, *self._GIT_WORKTREE_REMOVE, path),
+                env=self._git_env,
+                close_fds=False,
                 check=True,
                 capture_output=True,
                 text=True,
@@ -172,8 +553,9 @@ class GitHubRepoAdapter:
         """
         try:
             subprocess.run(
-                ["git", "push", "-u", "origin", branch],
-                cwd=str(self.repo_root),
+                (*self._git_base, *self._GIT_PUSH, branch),
+                env=self._git_env,
+                close_fds=False,
                 check=True,
                 capture_output=True,
                 text=True,
@@ -181,6 +563,206 @@ class GitHubRepoAdapter:
         except subprocess.CalledProcessError as e:
             raise RuntimeError(f"Failed to push branch {branch}: {e.stderr}") from e
 
+    def _gh(
+        self,
+        args: list[str],
+        *,
+        priority: str = "default",
+        mutative: bool = True,
+        text: bool = True,
+    ) -> subprocess.CompletedProcess[Any]:
+        """Run a gh command through the rate limiter.
+
+        Pass ``text=False`` to get stdout/stderr as bytes, e.g. for output that
+        goes straight to a JSON parser.
+
+        Raises:
+            subprocess.CalledProcessError: If gh exits non-zero after retries.
+        """
+        return self._rate_limiter.submit(
+            lambda: subprocess.run(
+                args,
+                cwd=self._repo_root_str,
+                check=True,
+                capture_output=True,
+                text=text,
+            ),
+            priority=priority,
+            mutative=mutative,
+            resource=_gh_resource(args),
+        )
+
+    def _api(
+        self,
+        method: str,
+        path: str,
+        *,
+        body: dict[str, Any] | None = None,
+        priority: str = "default",
+        mutative: bool = True,
+    ) -> httpx.Response:
+        """Call the GitHub REST API directly through the rate limiter.
+
+        Raises:
+            httpx.HTTPError: If the request fails after retries.
+        """
+        assert self._token is not None
+        with self._http_lock:
+            if self._http is None:
+                self._http = _http_client(self._token)
+            http = self._http
+
+        def send() -> httpx.Response:
+            response = http.request(method, path, json=body)
+            self._rate_limiter.update(response.headers)
+            response.raise_for_status()
+            return response
+
+        return self._rate_limiter.submit(
+            send, priority=priority, mutative=mutative, resource="core"
+        )
+
+    @staticmethod
+    def _pr_from_rest(data: dict[str, Any]) -> PRRecord:
+        """Build a PRRecord from a REST ``GET /pulls/{number}`` response."""
+        merged_at = None
+        if data.get("merged_at"):
+            merged_at = datetime.fromisoformat(data["merged_at"])
+
+        closed_at = None
+        if data.get("closed_at"):
+            closed_at = datetime.fromisoformat(data["closed_at"])
+
+        return PRRecord(
+            id=str(data["number"]),
+            title=data.get("title", ""),
+            branch=data["head"]["ref"],
+            base=data["base"]["ref"],
+            # REST only knows open/closed; match gh's "merged" state
+            status="merged" if merged_at else data.get("state", ""),
+            lines_added=data.get("additions", 0),
+            lines_deleted=data.get("deletions", 0),
+            files_changed=data.get("changed_files", 0),
+            url=data.get("html_url"),
+            merged_at=merged_at,
+            closed_at=closed_at,
+        )
+
+    def _create_pr_args(
+        self, title: str, body: str, head: str, base: str
+    ) -> list[str]:
+        """Build the ``gh pr create`` argv."""
+        return [
+            _GH,
+            "pr",
+            "create",
+            "--title",
+            title,
+            "--body",
+            body,
+            "--head",
+            head,
+            "--base",
+            base,
+            "--repo",
+            f"{self.owner}/{self.name}",
+        ]
+
+    def _view_pr_args(self, pr_id: str) -> list[str]:
+        """Build the ``gh pr view`` argv."""
+        return [
+            _GH,
+            "pr",
+            "view",
+            pr_id,
+            "--repo",
+            f"{self.owner}/{self.name}",
+            "--json",
+            "number,title,body,state,headRefName,baseRefName,url,additions,deletions,changedFiles,mergedAt,closedAt",
+        ]
+
+    def _merge_pr_args(self, pr_id: str) -> list[str]:
+        """Build the ``gh pr merge`` argv."""
+        return [
+            _GH,
+            "pr",
+            "merge",
+            pr_id,
+            "--repo",
+            f"{self.owner}/{self.name}",
+            "--merge",  # Use merge commit (not squash or rebase)
+        ]
+
+    @staticmethod
+    def _pr_from_data(data: dict[str, Any]) -> PRRecord:
+        """Build a PRRecord from gh/GraphQL pull request fields."""
+        # Parse timestamps
+        merged_at = None
+        if data.get("mergedAt"):
+            merged_at = datetime.fromisoformat(data["mergedAt"])
+
+        closed_at = None
+        if data.get("closedAt"):
+            closed_at = datetime.fromisoformat(data["closedAt"])
+
+        return PRRecord(
+            id=str(data["number"]),
+            title=data.get("title", ""),
+            branch=data.get("headRefName", ""),
+            base=data.get("baseRefName", "main"),
+            status=data.get("state", "").lower(),
+            lines_added=data.get("additions", 0),
+            lines_deleted=data.get("deletions", 0),
+            files_changed=data.get("changedFiles", 0),
+            url=data.get("url"),
+            merged_at=merged_at,
+            closed_at=closed_at,
+        )
+
+    def _parse_pr(self, raw: str | bytes) -> PRRecord:
+        """Parse ``gh pr view --json`` output into a PRRecord.
+
+        Raises:
+            RuntimeError: If the output is not valid PR JSON.
+        """
+        try:
+            return self._pr_from_data(_json_loads(raw))
+        except (json.JSONDecodeError, KeyError) as e:
+            raise RuntimeError(f"Failed to parse PR data: {e}") from e
+
+    def _cached_pr(self, pr_id: str) -> PRRecord | None:
+        """Return a cached PR if it is younger than ``pr_cache_ttl``."""
+        entry = self._pr_cache.get(pr_id)
+        if entry is None:
+            return None
+        fetched_at, record = entry
+        if time.monotonic() - fetched_at >= self.pr_cache_ttl:
+            self._pr_cache.pop(pr_id, None)
+            return None
+        return record
+
+    @contextlib.contextmanager
+    def _evicting_prs(self, *pr_ids: str) -> Iterator[None]:
+        """Drop PRs from the cache before and after a write to them.
+
+        The second eviction is best effort: it discards state a concurrent
+        ``get_pr`` cached while the write was in flight, but a read that
+        finishes after it still caches the old state until the TTL expires.
+        """
+        for pr_id in pr_ids:
+            self._pr_cache.pop(pr_id, None)
+        try:
+            yield
+        finally:
+            for pr_id in pr_ids:
+                self._pr_cache.pop(pr_id, None)
+
+    def _cache_pr(self, record: PRRecord) -> PRRecord:
+        """Store a freshly fetched PR in the cache."""
+        if self.pr_cache_ttl > 0:
+            self._pr_cache[record.id] = (time.monotonic(), record)
+        return record
+
     def create_pr(
         self,
         title: str,
@@ -204,35 +786,19 @@ class GitHubRepoAdapter:
             RuntimeError: If PR creation fails.
         """
         try:
-            result = subprocess.run(
-                [
-                    "gh",
-                    "pr",
-                    "create",
-                    "--title",
-                    title,
-                    "--body",
-                    body,
-                    "--head",
-                    head,
-                    "--base",
-                    base,
-                    "--repo",
-                    f"{self.owner}/{self.name}",
-                ],
-                cwd=str(self.repo_root),
-                check=True,
-                capture_output=True,
-                text=True,
+            result = self._gh(
+                self._create_pr_args(title, body, head, base),
+                priority="create",
+                text=False,
             )
 
             # Extract PR number from URL in output
             # Output is typically: https://github.com/owner/repo/pull/123
             pr_url = result.stdout.strip()
-            pr_number = pr_url.split("/")[-1]
+            pr_number = pr_url.rsplit(b"/", 1)[-1].decode()
             return pr_number
         except subprocess.CalledProcessError as e:
-            raise RuntimeError(f"Failed to create PR: {e.stderr}") from e
+            raise RuntimeError(f"Failed to create PR: {decode_output(e.stderr)}") from e
 
     def get_pr(self, pr_id: str) -> PRRecord:
         """Get current state of a pull request.
@@ -246,56 +812,311 @@ class GitHubRepoAdapter:
         Raises:
             RuntimeError: If fetching PR fails.
         """
+        cached = self._cached_pr(pr_id)
+        if cached is not None:
+            return cached
+
+        if self._token is not None:
+            try:
+                response = self._api(
+                    "GET",
+                    f"/repos/{self.owner}/{self.name}/pulls/{pr_id}",
+                    mutative=False,
+                )
+            except httpx.HTTPError as e:
+                raise RuntimeError(f"Failed to get PR {pr_id}: {e}") from e
+            try:
+                return self._cache_pr(self._pr_from_rest(_json_loads(response.content)))
+            except (json.JSONDecodeError, KeyError, TypeError) as e:
+                raise RuntimeError(f"Failed to parse PR data: {e}") from e
+
         try:
-            result = subprocess.run(
-                [
-                    "gh",
-                    "pr",
-                    "view",
-                    pr_id,
-                    "--repo",
-                    f"{self.owner}/{self.name}",
-                    "--json",
-                    "number,title,body,state,headRefName,baseRefName,url,additions,deletions,changedFiles,mergedAt,closedAt",
-                ],
-                cwd=str(self.repo_root),
-                check=True,
-                capture_output=True,
-                text=True,
+            result = self._gh(self._view_pr_args(pr_id), mutative=False, text=False)
+        except subprocess.CalledProcessError as e:
+            raise RuntimeError(
+                f"Failed to get PR {pr_id}: {decode_output(e.stderr)}"
+            ) from e
+
+        return self._cache_pr(self._parse_pr(result.stdout))
+
+    def _graphql(
+        self,
+        query: str,
+        variables: dict[str, str],
+        *,
+        priority: str = "default",
+        mutative: bool = False,
+    ) -> dict[str, Any]:
+        """Run a GraphQL request through ``gh api graphql``.
+
+        Variables are passed as raw string fields (``-f``), so user text
+        never has to be escaped into the query itself.
+
+        Returns:
+            The response's ``data`` object.
+
+        Raises:
+            subprocess.CalledProcessError: If gh exits non-zero.
+            json.JSONDecodeError, KeyError: If the response is malformed.
+        """
+        result = self._gh(
+            self._graphql_args(query, variables),
+            priority=priority,
+            mutative=mutative,
+            text=False,
+        )
+        return _json_loads(result.stdout)["data"]
+
+    @staticmethod
+    def _graphql_args(query: str, variables: dict[str, str]) -> list[str]:
+        """Build the ``gh api graphql`` argv for a query and its variables."""
+        args = [_GH, "api", "graphql", "-f", f"query={query}"]
+        for key, value in variables.items():
+            args += ["-f", f"{key}={value}"]
+        return args
+
+    def _run_batch(
+        self,
+        mutation: str,
+        variables: dict[str, str],
+        count: int,
+        priority: str,
+        action: str,
+    ) -> list[str]:
+        """Run an aliased PR mutation (``pr0`` .. ``pr{count-1}``).
+
+        Each alias must select ``pullRequest { number }``. GitHub applies the
+        aliases independently and gh exits non-zero if any fails, with the
+        results of the others still in its output.
+
+        Returns:
+            PR numbers in alias order.
+
+        Raises:
+            BatchError: If any alias failed.
+        """
+        try:
+            output = self._gh(
+                self._graphql_args(mutation, variables),
+                priority=priority,
+                mutative=True,
+                text=False,
+            ).stdout
+            error = ""
+        except subprocess.CalledProcessError as e:
+            output = e.stdout
+            error = decode_output(e.stderr).strip()
+
+        results = self._batch_results(output, count)
+        done = [number for number in results if number is not None]
+        if error or len(done) < count:
+            raise BatchError(
+                f"Failed to {action}: {error or 'incomplete response'}"
+                f" (succeeded: {', '.join(done) or 'none'})",
+                results,
             )
+        return done
 
-            data = json.loads(result.stdout)
+    @staticmethod
+    def _batch_results(output: bytes | None, count: int) -> list[str | None]:
+        """Extract per-alias PR numbers from a (possibly failed) batch response."""
+        try:
+            data = _json_loads(output or b"null")["data"] or {}
+        except (json.JSONDecodeError, KeyError, TypeError):
+            data = {}
+        results: list[str | None] = []
+        for i in range(count):
+            pull_request = (data.get(f"pr{i}") or {}).get("pullRequest") or {}
+            number = pull_request.get("number")
+            results.append(None if number is None else str(number))
+        return results
 
-            # Parse timestamps
-            merged_at = None
-            if data.get("mergedAt"):
-                merged_at = datetime.fromisoformat(
-                    data["mergedAt"].replace("Z", "+00:00")
-                )
+    @staticmethod
+    def _pr_numbers(pr_ids: list[str]) -> list[int]:
+        """Validate PR identifiers for interpolation into a GraphQL query."""
+        try:
+            return [int(pr_id) for pr_id in pr_ids]
+        except ValueError as e:
+            raise RuntimeError(f"Invalid PR identifier: {e}") from e
 
-            closed_at = None
-            if data.get("closedAt"):
-                closed_at = datetime.fromisoformat(
-                    data["closedAt"].replace("Z", "+00:00")
-                )
+    @staticmethod
+    def _pr_lookup_query(numbers: list[int], selection: str) -> str:
+        """Build a query fetching ``selection`` for several PRs by number.
+
+        Each PR gets an aliased field: pr0: pullRequest(number: 41) { ... }
+        """
+        fields = " ".join(
+            f"pr{i}: pullRequest(number: {number}) {{ {selection} }}"
+            for i, number in enumerate(numbers)
+        )
+        return (
+            "query($owner: String!, $name: String!) {"
+            f" repository(owner: $owner, name: $name) {{ {fields} }} }}"
+        )
+
+    def _repository_id(self) -> str:
+        """Return the repository's GraphQL node ID, fetching it once."""
+        if self._repo_node_id is None:
+            data = self._graphql(
+                "query($owner: String!, $name: String!) {"
+                " repository(owner: $owner, name: $name) { id } }",
+                {"owner": self.owner, "name": self.name},
+            )
+            self._repo_node_id = data["repository"]["id"]
+        return self._repo_node_id
+
+    def get_prs(self, pr_ids: list[str]) -> list[PRRecord]:
+        """Get current state of several pull requests in one GraphQL request.
+
+        Args:
+            pr_ids: PR identifiers (numbers).
 
-            return PRRecord(
-                id=str(data["number"]),
-                title=data.get("title", ""),
-                branch=data.get("headRefName", ""),
-                base=data.get("baseRefName", "main"),
-                status=data.get("state", "").lower(),
-                lines_added=data.get("additions", 0),
-                lines_deleted=data.get("deletions", 0),
-                files_changed=data.get("changedFiles", 0),
-                url=data.get("url"),
-                merged_at=merged_at,
-                closed_at=closed_at,
+        Returns:
+            PRRecords in the same order as ``pr_ids``.
+
+        Raises:
+            RuntimeError: If any PR is missing or the request fails.
+        """
+        if not pr_ids:
+            return []
+
+        try:
+            data = self._graphql(
+                self._prs_query(pr_ids), {"owner": self.owner, "name": self.name}
             )
         except subprocess.CalledProcessError as e:
-            raise RuntimeError(f"Failed to get PR {pr_id}: {e.stderr}") from e
+            raise RuntimeError(
+                f"Failed to get PRs {', '.join(pr_ids)}: {decode_output(e.stderr)}"
+            ) from e
         except (json.JSONDecodeError, KeyError) as e:
             raise RuntimeError(f"Failed to parse PR data: {e}") from e
+        return self._prs_from_data(pr_ids, data)
+
+    def _prs_query(self, pr_ids: list[str]) -> str:
+        """Build the GraphQL query behind ``get_prs``/``aget_prs``."""
+        return self._pr_lookup_query(self._pr_numbers(pr_ids), "...PR") + (
+            f" fragment PR on PullRequest {{ {_PR_GRAPHQL_FIELDS} }}"
+        )
+
+    def _prs_from_data(self, pr_ids: list[str], data: dict[str, Any]) -> list[PRRecord]:
+        """Build (and cache) PRRecords from a ``_prs_query`` response."""
+        try:
+            repository = data["repository"]
+            records = []
+            for i, pr_id in enumerate(pr_ids):
+                pr_data = repository[f"pr{i}"]
+                if pr_data is None:
+                    raise RuntimeError(f"Failed to get PR {pr_id}: not found")
+                records.append(self._cache_pr(self._pr_from_data(pr_data)))
+            return records
+        except (KeyError, TypeError) as e:
+            raise RuntimeError(f"Failed to parse PR data: {e}") from e
+
+    def create_prs(self, prs: list[PRCreateSpec]) -> list[str]:
+        """Create several pull requests with one GraphQL mutation.
+
+        The mutations in a request are not atomic: if some fail, the others
+        still create their PRs.
+
+        Args:
+            prs: PRs to create.
+
+        Returns:
+            PR identifiers in the same order as ``prs``.
+
+        Raises:
+            BatchError: If creating any PR fails; ``results`` holds the
+                numbers of the PRs that were created.
+            RuntimeError: If the repository cannot be looked up.
+        """
+        if not prs:
+            return []
+
+        try:
+            variables = {"repo": self._repository_id()}
+        except subprocess.CalledProcessError as e:
+            raise RuntimeError(
+                f"Failed to create PRs: {decode_output(e.stderr)}"
+            ) from e
+        except (json.JSONDecodeError, KeyError, TypeError) as e:
+            raise RuntimeError(f"Failed to parse repository data: {e}") from e
+
+        declarations = ["$repo: ID!"]
+        fields = []
+        for i, spec in enumerate(prs):
+            variables.update(
+                {
+                    f"title{i}": spec.title,
+                    f"body{i}": spec.body,
+                    f"head{i}": spec.head,
+                    f"base{i}": spec.base,
+                }
+            )
+            declarations += [
+                f"${key}{i}: String!" for key in ("title", "body", "head", "base")
+            ]
+            fields.append(
+                f"pr{i}: createPullRequest(input: {{repositoryId: $repo,"
+                f" title: $title{i}, body: $body{i},"
+                f" headRefName: $head{i}, baseRefName: $base{i}}})"
+                " { pullRequest { number } }"
+            )
+        mutation = f"mutation({', '.join(declarations)}) {{ {' '.join(fields)} }}"
+
+        return self._run_batch(mutation, variables, len(prs), "create", "create PRs")
+
+    def merge_prs(self, pr_ids: list[str]) -> None:
+        """Merge several pull requests with one GraphQL mutation.
+
+        Looks up the PRs' node IDs in one query, then merges them all (with
+        merge commits) in one mutation. The merges are not atomic: if some
+        fail, the others still go through.
+
+        Args:
+            pr_ids: PR identifiers (numbers).
+
+        Raises:
+            BatchError: If merging any PR fails; ``results`` holds the numbers
+                of the PRs that were merged.
+            RuntimeError: If a PR cannot be found.
+        """
+        if not pr_ids:
+            return
+
+        numbers = self._pr_numbers(pr_ids)
+        try:
+            repository = self._graphql(
+                self._pr_lookup_query(numbers, "id"),
+                {"owner": self.owner, "name": self.name},
+            )["repository"]
+
+            variables: dict[str, str] = {}
+            for i, pr_id in enumerate(pr_ids):
+                if repository[f"pr{i}"] is None:
+                    raise RuntimeError(f"Failed to merge PR {pr_id}: not found")
+                variables[f"id{i}"] = repository[f"pr{i}"]["id"]
+
+        except subprocess.CalledProcessError as e:
+            raise RuntimeError(
+                f"Failed to merge PRs {', '.join(pr_ids)}: {decode_output(e.stderr)}"
+            ) from e
+        except (json.JSONDecodeError, KeyError, TypeError) as e:
+            raise RuntimeError(f"Failed to parse PR data: {e}") from e
+
+        declarations = ", ".join(f"$id{i}: ID!" for i in range(len(pr_ids)))
+        fields = " ".join(
+            f"pr{i}: mergePullRequest(input: {{pullRequestId: $id{i},"
+            " mergeMethod: MERGE}) { pullRequest { number } }"
+            for i in range(len(pr_ids))
+        )
+        with self._evicting_prs(*pr_ids):
+            self._run_batch(
+                f"mutation({declarations}) {{ {fields} }}",
+                variables,
+                len(pr_ids),
+                "merge",
+                f"merge PRs {', '.join(pr_ids)}",
+            )
 
     def merge_pr(self, pr_id: str) -> None:
         """Merge a pull request.
@@ -306,24 +1127,22 @@ class GitHubRepoAdapter:
         Raises:
             RuntimeError: If merge fails.
         """
-        try:
-            subprocess.run(
-                [
-                    "gh",
-                    "pr",
-                    "merge",
-                    pr_id,
-                    "--repo",
-                    f"{self.owner}/{self.name}",
-                    "--merge",  # Use merge commit (not squash or rebase)
-                ],
-                cwd=str(self.repo_root),
-                check=True,
-                capture_output=True,
-                text=True,
-            )
-        except subprocess.CalledProcessError as e:
-            raise RuntimeError(f"Failed to merge PR {pr_id}: {e.stderr}") from e
+        with self._evicting_prs(pr_id):
+            if self._token is not None:
+                try:
+                    self._api(
+                        "PUT",
+                        f"/repos/{self.owner}/{self.name}/pulls/{pr_id}/merge",
+                        body={"merge_method": "merge"},
+                        priority="merge",
+                    )
+                except httpx.HTTPError as e:
+                    raise RuntimeError(f"Failed to merge PR {pr_id}: {e}") from e
+            else:
+                try:
+                    self._gh(self._merge_pr_args(pr_id), priority="merge")
+                except subprocess.CalledProcessError as e:
+                    raise RuntimeError(f"Failed to merge PR {pr_id}: {e.stderr}") from e
 
     def add_pr_comment(self, pr_id: str, body: str) -> None:
         """Add a review comment to a pull request.
@@ -335,24 +1154,149 @@ class GitHubRepoAdapter:
         Raises:
             RuntimeError: If adding comment fails.
         """
+        with self._evicting_prs(pr_id):
+            if self._token is not None:
+                try:
+                    self._api(
+                        "POST",
+                        f"/repos/{self.owner}/{self.name}/issues/{pr_id}/comments",
+                        body={"body": body},
+                        priority="comment",
+                    )
+                except httpx.HTTPError as e:
+                    raise RuntimeError(
+                        f"Failed to add comment to PR {pr_id}: {e}"
+                    ) from e
+            else:
+                try:
+                    self._gh(
+                        [
+                            _GH,
+                            "api",
+                            "--include",  # Response headers feed the rate limiter
+                            f"repos/{self.owner}/{self.name}/issues/{pr_id}/comments",
+                            "-f",
+                            f"body={body}",
+                        ],
+                        priority="comment",
+                    )
+                except subprocess.CalledProcessError as e:
+                    raise RuntimeError(
+                        f"Failed to add comment to PR {pr_id}: {e.stderr}"
+                    ) from e
+
+    async def _aexec(self, args: list[str]) -> bytes:
+        """Run a command without blocking the event loop.
+
+        Returns:
+            Captured stdout.
+
+        Raises:
+            subprocess.CalledProcessError: If the command exits non-zero.
+        """
+        proc = await asyncio.create_subprocess_exec(
+            *args,
+            cwd=self._repo_root_str,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        stdout, stderr = await proc.communicate()
+        if proc.returncode:
+            raise subprocess.CalledProcessError(
+                proc.returncode,
+                args,
+                output=stdout,
+                stderr=stderr.decode(errors="replace"),
+            )
+        return stdout
+
+    async def acreate_pr(
+        self,
+        title: str,
+        body: str,
+        *,
+        head: str,
+        base: str = "main",
+    ) -> str:
+        """Async variant of ``create_pr``."""
         try:
-            subprocess.run(
-                [
-                    "gh",
-                    "api",
-                    f"repos/{self.owner}/{self.name}/issues/{pr_id}/comments",
-                    "-f",
-                    f"body={body}",
-                ],
-                cwd=str(self.repo_root),
-                check=True,
-                capture_output=True,
-                text=True,
+            stdout = await self._rate_limiter.asubmit(
+                lambda: self._aexec(self._create_pr_args(title, body, head, base)),
+                priority="create",
+                resource="graphql",
+            )
+        except subprocess.CalledProcessError as e:
+            raise RuntimeError(f"Failed to create PR: {e.stderr}") from e
+        return stdout.strip().rsplit(b"/", 1)[-1].decode()
+
+    async def aget_pr(self, pr_id: str) -> PRRecord:
+        """Async variant of ``get_pr``."""
+        cached = self._cached_pr(pr_id)
+        if cached is not None:
+            return cached
+
+        try:
+            stdout = await self._rate_limiter.asubmit(
+                lambda: self._aexec(self._view_pr_args(pr_id)),
+                mutative=False,
+                resource="graphql",
             )
+        except subprocess.CalledProcessError as e:
+            raise RuntimeError(f"Failed to get PR {pr_id}: {e.stderr}") from e
+        return self._cache_pr(self._parse_pr(stdout))
+
+    async def aget_prs(self, pr_ids: list[str]) -> list[PRRecord]:
+        """Async variant of ``get_prs``."""
+        if not pr_ids:
+            return []
+
+        args = self._graphql_args(
+            self._prs_query(pr_ids), {"owner": self.owner, "name": self.name}
+        )
+        try:
+            stdout = await self._rate_limiter.asubmit(
+                lambda: self._aexec(args), mutative=False, resource="graphql"
+            )
+            data = _json_loads(stdout)["data"]
         except subprocess.CalledProcessError as e:
             raise RuntimeError(
-                f"Failed to add comment to PR {pr_id}: {e.stderr}"
+                f"Failed to get PRs {', '.join(pr_ids)}: {decode_output(e.stderr)}"
             ) from e
+        except (json.JSONDecodeError, KeyError) as e:
+            raise RuntimeError(f"Failed to parse PR data: {e}") from e
+        return self._prs_from_data(pr_ids, data)
+
+    async def amerge_pr(self, pr_id: str) -> None:
+        """Async variant of ``merge_pr``."""
+        with self._evicting_prs(pr_id):
+            try:
+                await self._rate_limiter.asubmit(
+                    lambda: self._aexec(self._merge_pr_args(pr_id)),
+                    priority="merge",
+                    resource="graphql",
+                )
+            except subprocess.CalledProcessError as e:
+                raise RuntimeError(f"Failed to merge PR {pr_id}: {e.stderr}") from e
+
+    @staticmethod
+    def _commit_from_fields(fields: list[bytes], branch: str | None) -> CommitInfo:
+        """Build a CommitInfo from one record of ``get_log`` output.
+
+        Fields stay bytes until here; only the ones kept are decoded.
+        """
+        sha, author, timestamp_raw, message = fields
+
+        # Parse timestamp; %ai is "2024-02-14 12:00:00 +0000", which
+        # fromisoformat accepts as-is on Python 3.11+
+        timestamp = datetime.fromisoformat(timestamp_raw.decode())
+
+        return CommitInfo(
+            sha=sha.decode(),
+            message=message.decode(),
+            author=author.decode(),
+            timestamp=timestamp,
+            branch=branch,
+        )
 
     def get_log(
         self,
@@ -375,54 +1319,90 @@ class GitHubRepoAdapter:
             RuntimeError: If reading log fails.
         """
         try:
-            args = ["git", "log"]
-
-            # Add since filter
+            # Prebuilt prefix with the output format, plus the result limit
+            args = [*self._git_base, *self._GIT_LOG, f"-{limit}"]
             if since:
                 args.append(f"--since={since.isoformat()}")
-
-            # Add branch filter
             if branch:
                 args.append(branch)
 
-            # Limit results
-            args.append(f"-{limit}")
-
-            # Format: %H (hash), %an (author), %ai (ISO date), %s (subject)
-            args.append("--format=%H|||%an|||%ai|||%s")
-
-            result = subprocess.run(
+            commits = []
+            with subprocess.Popen(
                 args,
-                cwd=str(self.repo_root),
-                check=True,
-                capture_output=True,
-                text=True,
-            )
+                env=self._git_env,
+                close_fds=False,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            ) as proc:
+                assert proc.stdout is not None and proc.stderr is not None
+                # Parse the NUL-separated field stream as git emits it, every
+                # _GIT_LOG_FIELDS fields making one commit. Counting fields
+                # (rather than splitting on a record separator) stays correct
+                # when a field such as the subject is empty.
+                fields: list[bytes] = []
+                pending = b""
+                for chunk in iter(lambda: proc.stdout.read1(65536), b""):
+                    *complete, pending = (pending + chunk).split(b"\0")
+                    for field in complete:
+                        fields.append(field)
+                        if len(fields) == self._GIT_LOG_FIELDS:
+                            commits.append(self._commit_from_fields(fields, branch))
+                            fields = []
+                if pending:
+                    # Output that ended without a final NUL
+                    fields.append(pending)
+                    if len(fields) == self._GIT_LOG_FIELDS:
+                        commits.append(self._commit_from_fields(fields, branch))
 
-            commits = []
-            for line in result.stdout.strip().split("\n"):
-                if not line:
-                    continue
-
-                parts = line.split("|||")
-                if len(parts) != 4:
-                    continue
-
-                sha, author, timestamp_str, message = parts
-
-                # Parse timestamp
-                timestamp = datetime.fromisoformat(timestamp_str.replace(" ", "T"))
-
-                commits.append(
-                    CommitInfo(
-                        sha=sha,
-                        message=message,
-                        author=author,
-                        timestamp=timestamp,
-                        branch=branch,
+                stderr = proc.stderr.read()
+                if proc.wait():
+                    raise subprocess.CalledProcessError(
+                        proc.returncode, args, stderr=stderr
                     )
-                )
 
             return commits
         except subprocess.CalledProcessError as e:
-            raise RuntimeError(f"Failed to get git log: {e.stderr}") from e
+            raise RuntimeError(
+                f"Failed to get git log: {decode_output(e.stderr)}"
+            ) from e
+
+    def get_logs(
+        self,
+        branches: list[str],
+        *,
+        since: datetime | None = None,
+        limit: int = 50,
+    ) -> dict[str, list[CommitInfo]]:
+        """Get commit logs for several branches concurrently.
+
+        Each branch gets its own ``git log`` process; the threads spend their
+        time waiting on those (with the GIL released), so logs are read in
+        parallel.
+
+        Args:
+            branches: Branches to read logs from.
+            since: Only commits after this timestamp.
+            limit: Maximum number of commits to return per branch.
+
+        Returns:
+            Commits per branch, most recent first, keyed in ``branches`` order.
+
+        Raises:
+            RuntimeError: If reading any log fails.
+        """
+        unique = list(dict.fromkeys(branches))
+        if not unique:
+            return {}
+
+        logs: dict[str, list[CommitInfo]] = {}
+        with ThreadPoolExecutor(max_workers=min(8, len(unique))) as executor:
+            futures = {
+                executor.submit(
+                    self.get_log, branch=branch, since=since, limit=limit
+                ): branch
+                for branch in unique
+            }
+            for future in as_completed(futures):
+                logs[futures[future]] = future.result()
+
+        return {branch: logs[branch] for branch in unique}
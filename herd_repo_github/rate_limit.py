@@ -0,0 +1,316 @@
+"""Client-side rate limiting for GitHub API calls."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from collections.abc import Awaitable, Callable, Mapping
+from typing import TypeVar
+
+T = TypeVar("T")
+
+# Lower rank runs first when several mutative calls are queued
+PRIORITIES = {"merge": 0, "create": 1, "comment": 2, "default": 3}
+
+_STATUS_RE = re.compile(r"^HTTP/[\d.]+ (\d{3})|\(HTTP (\d{3})\)|HTTP (\d{3}):", re.M)
+
+
+def parse_headers(text: str) -> dict[str, str]:
+    """Parse response headers from ``gh api --include`` output.
+
+    Args:
+        text: Raw output, starting with the HTTP status line.
+
+    Returns:
+        Header names (lower-cased) mapped to values. Empty if the output
+        carries no headers.
+    """
+    if not text.startswith("HTTP/"):
+        return {}
+
+    headers: dict[str, str] = {}
+    for line in text.splitlines()[1:]:
+        if not line.strip():
+            break
+        key, sep, value = line.partition(":")
+        if sep:
+            headers[key.strip().lower()] = value.strip()
+    return headers
+
+
+def decode_output(output: str | bytes | None) -> str:
+    """Normalize captured process output to text."""
+    if isinstance(output, bytes):
+        return output.decode(errors="replace")
+    return output or ""
+
+
+class RateLimiter:
+    """Paces GitHub calls to stay clear of primary and secondary rate limits.
+
+    Mutative calls (create, merge, comment) run one at a time, at least
+    ``min_interval`` seconds apart, in priority order. Any call that fails
+    with a rate-limit response pauses all traffic until ``retry-after``,
+    ``x-ratelimit-reset`` or an exponential backoff delay has passed, then
+    is retried up to ``max_retries`` times.
+
+    Remaining quota is tracked per API resource (``core``, ``graphql``, ...)
+    from ``x-ratelimit-resource``. A call against an exhausted resource waits
+    for its reset, or fails straight away if that is more than
+    ``backoff_max`` seconds off.
+
+    Rate limits are per token, so adapters sharing credentials should share
+    one limiter.
+    """
+
+    def __init__(
+        self,
+        *,
+        min_interval: float = 1.0,
+        max_retries: int = 3,
+        backoff_base: float = 1.0,
+        backoff_max: float = 60.0,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """Initialize the rate limiter.
+
+        Args:
+            min_interval: Minimum seconds between mutative calls.
+            max_retries: Retries after a rate-limit response before giving up.
+            backoff_base: First backoff delay when GitHub gives no hint.
+            backoff_max: Upper bound for backoff delays and for waiting on an
+                exhausted resource's reset.
+            clock: Wall-clock source (epoch seconds, as in ``x-ratelimit-reset``).
+            sleep: Blocking sleep function.
+        """
+        self.min_interval = min_interval
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._clock = clock
+        self._sleep = sleep
+
+        # Per resource, from the latest response headers
+        self.remaining: dict[str, int] = {}
+        self.reset: dict[str, float] = {}
+        self.backoff_until = 0.0
+
+        self._cond = threading.Condition()
+        self._queue: list[tuple[int, int]] = []
+        self._counter = itertools.count()
+        self._busy = False
+        self._last_mutation = float("-inf")
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        """Record rate-limit state from response headers.
+
+        Args:
+            headers: Response headers with lower-cased names.
+        """
+        resource = headers.get("x-ratelimit-resource", "core")
+        with self._cond:
+            try:
+                if "x-ratelimit-remaining" in headers:
+                    self.remaining[resource] = int(headers["x-ratelimit-remaining"])
+                if "x-ratelimit-reset" in headers:
+                    self.reset[resource] = float(headers["x-ratelimit-reset"])
+            except ValueError:
+                pass
+
+    def submit(
+        self,
+        fn: Callable[[], T],
+        *,
+        priority: str = "default",
+        mutative: bool = True,
+        resource: str = "core",
+    ) -> T:
+        """Run a GitHub call under the rate limiter.
+
+        Args:
+            fn: Zero-argument callable performing the call. Rate-limit
+                failures must surface as an exception carrying the response,
+                either in ``stdout``/``stderr`` (``CalledProcessError``) or
+                as a ``response`` object (``httpx.HTTPStatusError``).
+            priority: Queue priority for mutative calls (see ``PRIORITIES``).
+            mutative: Whether the call writes; reads skip serialization.
+            resource: GitHub API resource whose quota the call spends.
+
+        Returns:
+            Whatever ``fn`` returns.
+
+        Raises:
+            RuntimeError: If ``resource`` is exhausted for longer than
+                ``backoff_max``.
+            Exception: Whatever ``fn`` raises once retries are exhausted or
+                the failure is not rate-limit related.
+        """
+        attempt = 0
+        while True:
+            if mutative:
+                self._acquire(priority, resource)
+            else:
+                self._sleep_for(self._clear_delay(resource))
+            try:
+                result = fn()
+            except Exception as e:
+                if not self._handle_failure(e, attempt):
+                    raise
+                attempt += 1
+                continue
+            finally:
+                if mutative:
+                    self._release()
+            stdout = getattr(result, "stdout", None)
+            # Only --include output carries headers; check before decoding it all
+            if stdout and stdout[:5] in (b"HTTP/", "HTTP/"):
+                self.update(parse_headers(decode_output(stdout)))
+            return result
+
+    async def asubmit(
+        self,
+        fn: Callable[[], Awaitable[T]],
+        *,
+        priority: str = "default",
+        mutative: bool = True,
+        resource: str = "core",
+    ) -> T:
+        """Async variant of ``submit`` for coroutine-returning callables."""
+        attempt = 0
+        while True:
+            if mutative:
+                await self._aacquire(priority, resource)
+            else:
+                delay = self._clear_delay(resource)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            try:
+                result = await fn()
+            except Exception as e:
+                if not self._handle_failure(e, attempt):
+                    raise
+                attempt += 1
+                continue
+            finally:
+                if mutative:
+                    self._release()
+            return result
+
+    async def _aacquire(self, priority: str, resource: str) -> None:
+        """Wait in a worker thread for this caller's turn to make a mutative call.
+
+        If the awaiting task is cancelled, the thread still runs to completion
+        and may take the slot; it is handed back before the cancellation
+        propagates so other callers are not blocked.
+        """
+        acquire = asyncio.ensure_future(
+            asyncio.to_thread(self._acquire, priority, resource)
+        )
+        try:
+            await asyncio.shield(acquire)
+        except asyncio.CancelledError:
+            await asyncio.wait({acquire})
+            if not acquire.cancelled() and acquire.exception() is None:
+                self._release()
+            raise
+
+    def _sleep_for(self, delay: float) -> None:
+        if delay > 0:
+            self._sleep(delay)
+
+    def _clear_delay(self, resource: str) -> float:
+        """Seconds until a call against ``resource`` may be made.
+
+        Raises:
+            RuntimeError: If that is more than ``backoff_max`` seconds off.
+        """
+        now = self._clock()
+        until = self.backoff_until
+        reset = self.reset.get(resource)
+        if self.remaining.get(resource) == 0 and reset is not None and reset > until:
+            if reset - now > self.backoff_max:
+                raise RuntimeError(
+                    f"GitHub {resource} rate limit exhausted until"
+                    f" {datetime.fromtimestamp(reset, timezone.utc).isoformat()}"
+                )
+            until = reset
+        return until - now
+
+    def _acquire(self, priority: str, resource: str = "core") -> None:
+        """Wait for this caller's turn to make a mutative call."""
+        ticket = (PRIORITIES.get(priority, PRIORITIES["default"]), next(self._counter))
+        with self._cond:
+            heapq.heappush(self._queue, ticket)
+            while self._busy or self._queue[0] != ticket:
+                self._cond.wait()
+            heapq.heappop(self._queue)
+            self._busy = True
+        try:
+            delay = max(
+                self._clear_delay(resource),
+                self._last_mutation + self.min_interval - self._clock(),
+            )
+            self._sleep_for(delay)
+        except BaseException:
+            # Quota exhausted or interrupted (e.g. KeyboardInterrupt) before the
+            # call ran
+            self._release()
+            raise
+
+    def _release(self) -> None:
+        with self._cond:
+            self._busy = False
+            self._last_mutation = self._clock()
+            self._cond.notify_all()
+
+    def _handle_failure(self, error: Exception, attempt: int) -> bool:
+        """Schedule a backoff if ``error`` is a rate-limit response.
+
+        Returns:
+            True if the call should be retried.
+        """
+        response = getattr(error, "response", None)
+        if response is not None and hasattr(response, "status_code"):
+            # HTTP client error (e.g. httpx.HTTPStatusError)
+            status = response.status_code
+            headers = {key.lower(): value for key, value in response.headers.items()}
+            text = response.text
+        else:
+            # gh failure (CalledProcessError): status and headers are in the output
+            text = "\n".join(
+                (
+                    decode_output(getattr(error, "stdout", None)),
+                    decode_output(getattr(error, "stderr", None)),
+                )
+            )
+            match = _STATUS_RE.search(text)
+            status = int(next(filter(None, match.groups()))) if match else None
+            headers = parse_headers(text.lstrip())
+        self.update(headers)
+        resource = headers.get("x-ratelimit-resource", "core")
+
+        rate_limited = (
+            status == 429
+            or "rate limit" in text.lower()
+            or (status == 403 and headers.get("x-ratelimit-remaining") == "0")
+        )
+        if not rate_limited or attempt >= self.max_retries:
+            return False
+
+        if headers.get("retry-after", "").isdigit():
+            delay = float(headers["retry-after"])
+        elif headers.get("x-ratelimit-remaining") == "0" and resource in self.reset:
+            delay = self.reset[resource] - self._clock()
+        else:
+            delay = self.backoff_base * 2**attempt
+        delay = min(max(delay, 0.0), self.backoff_max)
+
+        with self._cond:
+            self.backoff_until = max(self.backoff_until, self._clock() + delay)
+        return True
@@ -1,21 +1,45 @@
 """Tests for GitHubRepoAdapter."""
 
-from datetime import datetime
+import io
+from datetime import datetime, timezone
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from herd_core.adapters.repo import RepoAdapter
 from herd_core.types import CommitInfo, PRRecord
-from herd_repo_github import GitHubRepoAdapter
+from herd_repo_github import BatchError, GitHubRepoAdapter, PRCreateSpec, RateLimiter
+from herd_repo_github.adapter import (
+    _GH,
+    _GIT,
+    _GitSession,
+    _gh_resource,
+    _parse_remote_url,
+    _remote_repo_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_remote_cache():
+    """Reset the per-process remote lookup cache between tests."""
+    _remote_repo_cache.clear()
+    yield
+    _remote_repo_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def no_github_token(monkeypatch):
+    """Keep PR operations on the gh path unless a test opts into HTTP."""
+    monkeypatch.delenv("GH_TOKEN", raising=False)
+    monkeypatch.delenv("GITHUB_TOKEN", raising=False)
 
 
 @pytest.fixture
 def adapter():
     """Create a test adapter instance."""
     with patch("subprocess.run") as mock_run:
-        # Mock the git remote get-url call in __init__
+        # Mock the remote URL lookup in __init__
         mock_run.return_value = MagicMock(
             stdout="https://github.com/test-owner/test-repo.git\n",
             returncode=0,
@@ -70,6 +94,163 @@ def test_init_explicit_owner_name():
         assert adapter.name == "custom-repo"
 
 
+@pytest.mark.parametrize(
+    "remote_url, expected",
+    [
+        ("https://github.com/owner/repo.git\n", ("owner", "repo")),
+        ("https://github.com/owner/repo/", ("owner", "repo")),
+        ("git@github.com:owner/repo.git", ("owner", "repo")),
+        ("ssh://git@github.com/o/o.github.io.git", ("o", "o.github.io")),
+        ("origin\tgit@github.com:owner/repo.git (fetch)", ("owner", "repo")),
+        ("ssh://git@ssh.github.com:443/owner/repo.git", ("owner", "repo")),
+        ("ssh://git@github.com:22/o/r.git", ("o", "r")),
+        ("https://github.com:443/o/r.git", ("o", "r")),
+        ("git@github.com:12345/repo.git", ("12345", "repo")),
+        ("https://gitlab.com/owner/repo.git", None),
+        ("https://notgithub.com/o/r", None),
+        ("https://github.com/owner", None),
+    ],
+)
+def test_parse_remote_url(remote_url, expected):
+    """Test owner/name extraction from remote URLs."""
+    assert _parse_remote_url(remote_url) == expected
+
+
+def test_init_reads_git_config(tmp_path):
+    """Test detection from .git/config without running git."""
+    git_dir = tmp_path / ".git"
+    git_dir.mkdir()
+    (git_dir / "config").write_text(
+        "[core]\n"
+        "\tbare = false\n"
+        '[remote "origin"]\n'
+        "\turl = git@github.com:dbt-conceptual/herd-repo-github.git\n"
+        "\tfetch = +refs/heads/*:refs/remotes/origin/*\n"
+    )
+
+    with patch("subprocess.run") as mock_run:
+        adapter = GitHubRepoAdapter(repo_root=str(tmp_path))
+
+        mock_run.assert_not_called()
+        assert adapter.owner == "dbt-conceptual"
+        assert adapter.name == "herd-repo-github"
+
+
+def test_init_falls_back_to_git_remote():
+    """Test that git is asked directly when .git/config cannot be read."""
+    with patch("subprocess.run") as mock_run:
+        mock_run.return_value = MagicMock(
+            stdout="https://github.com/dbt-conceptual/herd-repo-github.git\n",
+            returncode=0,
+        )
+
+        GitHubRepoAdapter(repo_root="/tmp/test")
+
+        args = mock_run.call_args[0][0]
+        assert args == (
+            _GIT,
+            "--no-pager",
+            "-C",
+            "/tmp/test",
+            "remote",
+            "get-url",
+            "origin",
+        )
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        '"git@github.com:own/rep.git"',
+        "git@github.com:own/rep.git ; moved",
+    ],
+)
+def test_init_git_config_quoted_value_uses_git(tmp_path, url):
+    """Test that values configparser would misread are left to git."""
+    git_dir = tmp_path / ".git"
+    git_dir.mkdir()
+    (git_dir / "config").write_text(f'[remote "origin"]\n\turl = {url}\n')
+
+    with patch("subprocess.run") as mock_run:
+        mock_run.return_value = MagicMock(
+            stdout="git@github.com:own/rep.git\n", returncode=0
+        )
+
+        adapter = GitHubRepoAdapter(repo_root=str(tmp_path))
+
+        mock_run.assert_called_once()
+        assert (adapter.owner, adapter.name) == ("own", "rep")
+
+
+def test_init_remote_lookup_cached():
+    """Test that the remote is only looked up once per repository root."""
+    with patch("subprocess.run") as mock_run:
+        mock_run.return_value = MagicMock(
+            stdout="https://github.com/dbt-conceptual/herd-repo-github.git\n",
+            returncode=0,
+        )
+
+        GitHubRepoAdapter(repo_root="/tmp/test")
+        adapter = GitHubRepoAdapter(repo_root="/tmp/test")
+
+        mock_run.assert_called_once()
+        assert adapter.owner == "dbt-conceptual"
+
+
+def test_init_remote_lookup_relative_root(tmp_path, monkeypatch):
+    """Test that a relative root is cached per resolved directory."""
+    for repo, url in (
+        ("first", "git@github.com:own/rep.git"),
+        ("second", "git@github.com:other/proj.git"),
+    ):
+        git_dir = tmp_path / repo / ".git"
+        git_dir.mkdir(parents=True)
+        (git_dir / "config").write_text(f'[remote "origin"]\n\turl = {url}\n')
+
+    monkeypatch.chdir(tmp_path / "first")
+    first = GitHubRepoAdapter(repo_root=".")
+    monkeypatch.chdir(tmp_path / "second")
+    second = GitHubRepoAdapter(repo_root=".")
+
+    assert (first.owner, first.name) == ("own", "rep")
+    assert (second.owner, second.name) == ("other", "proj")
+
+
+def test_init_remote_lookup_failure_not_cached():
+    """Test that a missing remote is looked up again by later adapters."""
+    import subprocess
+
+    with patch("subprocess.run") as mock_run:
+        mock_run.side_effect = subprocess.CalledProcessError(
+            returncode=1, cmd=["git", "config"]
+        )
+        adapter = GitHubRepoAdapter(repo_root="/tmp/test")
+        assert adapter.owner == ""
+
+        mock_run.side_effect = None
+        mock_run.return_value = MagicMock(
+            stdout="https://github.com/dbt-conceptual/herd-repo-github.git\n",
+            returncode=0,
+        )
+        adapter = GitHubRepoAdapter(repo_root="/tmp/test")
+
+        assert mock_run.call_count == 2
+        assert adapter.owner == "dbt-conceptual"
+
+
+@pytest.mark.parametrize(
+    "args, expected",
+    [
+        ([_GH, "pr", "view", "42"], "graphql"),
+        ([_GH, "api", "graphql", "-f", "query={}"], "graphql"),
+        ([_GH, "api", "--include", "repos/o/r/issues/42/comments"], "core"),
+    ],
+)
+def test_gh_resource(args, expected):
+    """Test which rate-limit resource each gh command is charged to."""
+    assert _gh_resource(args) == expected
+
+
 def test_create_branch(adapter):
     """Test branch creation."""
     with patch("subprocess.run") as mock_run:
@@ -80,7 +261,39 @@ def test_create_branch(adapter):
         assert result == "feature-branch"
         mock_run.assert_called_once()
         args = mock_run.call_args[0][0]
-        assert args[:3] == ["git", "branch", "feature-branch"]
+        assert args[:6] == (*adapter._git_base, "branch", "feature-branch")
+
+
+def test_git_invocation(adapter):
+    """Test git is spawned via -C, posix_spawn-eligible, with prompts disabled."""
+    with patch("subprocess.run") as mock_run:
+        mock_run.return_value = MagicMock(returncode=0)
+
+        adapter.create_branch("feature-branch")
+
+        args = mock_run.call_args[0][0]
+        kwargs = mock_run.call_args.kwargs
+        assert args[:4] == (_GIT, "--no-pager", "-C", "/tmp/test-repo")
+        assert "cwd" not in kwargs
+        # Required for CPython's posix_spawn path
+        assert kwargs["close_fds"] is False
+        assert "preexec_fn" not in kwargs
+        assert kwargs["env"]["GIT_OPTIONAL_LOCKS"] == "0"
+        assert kwargs["env"]["GIT_TERMINAL_PROMPT"] == "0"
+
+
+def test_gh_invocation(adapter):
+    """Test gh is spawned through the executable resolved at import."""
+    import json
+
+    pr_data = {"number": 42, "title": "Test PR", "state": "OPEN"}
+
+    with patch("subprocess.run") as mock_run:
+        mock_run.return_value = MagicMock(stdout=json.dumps(pr_data), returncode=0)
+
+        adapter.get_pr("42")
+
+        assert mock_run.call_args[0][0][0] == _GH
 
 
 def test_create_branch_failure(adapter):
@@ -100,35 +313,160 @@ def test_create_branch_failure(adapter):
 
 def test_create_worktree_new_branch(adapter):
     """Test worktree creation with new branch."""
-    with patch("subprocess.run") as mock_run:
-        # First call: branch check (fails - branch doesn't exist)
-        # Second call: worktree creation
-        mock_run.side_effect = [
-            MagicMock(returncode=1),  # Branch doesn't exist
-            MagicMock(returncode=0),  # Worktree created
-        ]
+    with (
+        patch.object(adapter, "_rev_exists", return_value=False),
+        patch("subprocess.run") as mock_run,
+    ):
+        mock_run.return_value = MagicMock(returncode=0)
 
         result = adapter.create_worktree("new-branch", "/tmp/worktree")
 
         assert Path(result).is_absolute()
         assert "worktree" in result
-        assert mock_run.call_count == 2
+        mock_run.assert_called_once()
+        assert "-b" in mock_run.call_args[0][0]
 
 
 def test_create_worktree_existing_branch(adapter):
     """Test worktree creation with existing branch."""
-    with patch("subprocess.run") as mock_run:
-        # First call: branch check (succeeds)
-        # Second call: worktree creation
-        mock_run.side_effect = [
-            MagicMock(returncode=0),  # Branch exists
-            MagicMock(returncode=0),  # Worktree created
-        ]
+    with (
+        patch.object(adapter, "_rev_exists", return_value=True),
+        patch("subprocess.run") as mock_run,
+    ):
+        mock_run.return_value = MagicMock(returncode=0)
 
         result = adapter.create_worktree("existing-branch", "/tmp/worktree")
 
         assert Path(result).is_absolute()
-        assert mock_run.call_count == 2
+        mock_run.assert_called_once()
+        assert "-b" not in mock_run.call_args[0][0]
+
+
+def test_create_worktree_reset_if_exists(adapter):
+    """Test single-call worktree creation with -B."""
+    with (
+        patch.object(adapter, "_rev_exists") as mock_exists,
+        patch("subprocess.run") as mock_run,
+    ):
+        mock_run.return_value = MagicMock(returncode=0)
+
+        adapter.create_worktree("agent-branch", "/tmp/worktree", reset_if_exists=True)
+
+        mock_exists.assert_not_called()
+        mock_run.assert_called_once()
+        args = mock_run.call_args[0][0]
+        assert args[4:8] == ("worktree", "add", "-B", "agent-branch")
+
+
+def test_git_session_resolve():
+    """Test object lookups through the persistent cat-file process."""
+    with patch("subprocess.Popen") as mock_popen:
+        proc = mock_popen.return_value
+        proc.stdout.readline.side_effect = [
+            b"6e8a5c3749113597924b69acfd9ce5e0cb779e06 commit\n",
+            b"nope missing\n",
+        ]
+
+        session = _GitSession(("git", "-C", "/tmp/test-repo"), {})
+
+        assert session.resolve("main") == "6e8a5c3749113597924b69acfd9ce5e0cb779e06"
+        assert session.resolve("nope") is None
+        proc.stdin.write.assert_any_call(b"main\n")
+        mock_popen.assert_called_once()
+
+
+def test_git_session_out_of_step():
+    """Test that a reply for another revision kills the session."""
+    with patch("subprocess.Popen") as mock_popen:
+        proc = mock_popen.return_value
+        proc.stdout.readline.return_value = b"main missing\n"
+
+        session = _GitSession(("git", "-C", "/tmp/test-repo"), {})
+
+        with pytest.raises(RuntimeError, match="answered for"):
+            session.resolve("nope")
+        proc.kill.assert_called_once()
+
+
+def test_rev_exists_multiline_rev_uses_rev_parse(adapter):
+    """Test that a rev that would break session framing is exec'd instead."""
+    with patch("subprocess.Popen") as mock_popen, patch("subprocess.run") as mock_run:
+        mock_run.return_value = MagicMock(returncode=1)
+
+        assert not adapter._rev_exists("nope\nmain")
+
+        mock_popen.return_value.stdin.write.assert_not_called()
+        assert mock_run.call_args[0][0][-1] == "nope\nmain"
+
+
+def test_git_session_reused_per_thread(adapter):
+    """Test that repeated lookups reuse one git process."""
+    with patch("subprocess.Popen") as mock_popen:
+        proc = mock_popen.return_value
+        proc.poll.return_value = None
+        proc.stdout.readline.return_value = b"abc123 commit\n"
+
+        assert adapter._rev_exists("main")
+        assert adapter._rev_exists("develop")
+        mock_popen.assert_called_once()
+
+        adapter.close()
+        proc.stdin.close.assert_called_once()
+
+
+def test_git_session_closed_by_context_manager():
+    """Test that leaving the with block shuts down git sessions."""
+    with patch("subprocess.Popen") as mock_popen:
+        proc = mock_popen.return_value
+        proc.poll.return_value = None
+        proc.stdout.readline.return_value = b"abc123 commit\n"
+
+        with GitHubRepoAdapter(
+            repo_root="/tmp/test-repo", owner="test-owner", name="test-repo"
+        ) as adapter:
+            assert adapter._rev_exists("main")
+
+        proc.stdin.close.assert_called_once()
+        assert adapter._sessions == {}
+
+
+def test_git_session_closed_on_garbage_collection():
+    """Test that an adapter that is never closed does not leak git processes."""
+    import gc
+
+    with patch("subprocess.Popen") as mock_popen:
+        proc = mock_popen.return_value
+        proc.poll.return_value = None
+        proc.stdout.readline.return_value = b"abc123 commit\n"
+
+        adapter = GitHubRepoAdapter(
+            repo_root="/tmp/test-repo", owner="test-owner", name="test-repo"
+        )
+        adapter._rev_exists("main")
+        del adapter
+        gc.collect()
+
+        proc.stdin.close.assert_called_once()
+
+
+def test_git_session_pruned_after_thread_exits(adapter):
+    """Test that sessions of finished threads are closed."""
+    import threading
+
+    with patch("subprocess.Popen") as mock_popen:
+        worker_proc, main_proc = MagicMock(), MagicMock()
+        mock_popen.side_effect = [worker_proc, main_proc]
+        for proc in (worker_proc, main_proc):
+            proc.poll.return_value = None
+            proc.stdout.readline.return_value = b"abc123 commit\n"
+
+        worker = threading.Thread(target=adapter._rev_exists, args=("main",))
+        worker.start()
+        worker.join()
+        adapter._rev_exists("main")
+
+        worker_proc.stdin.close.assert_called_once()
+        assert list(adapter._sessions) == [threading.current_thread()]
 
 
 def test_remove_worktree(adapter):
@@ -140,7 +478,7 @@ def test_remove_worktree(adapter):
 
         mock_run.assert_called_once()
         args = mock_run.call_args[0][0]
-        assert args[:3] == ["git", "worktree", "remove"]
+        assert args[:6] == (*adapter._git_base, "worktree", "remove")
 
 
 def test_push(adapter):
@@ -152,14 +490,14 @@ def test_push(adapter):
 
         mock_run.assert_called_once()
         args = mock_run.call_args[0][0]
-        assert args == ["git", "push", "-u", "origin", "feature-branch"]
+        assert args == (*adapter._git_base, "push", "-u", "origin", "feature-branch")
 
 
 def test_create_pr(adapter):
     """Test PR creation."""
     with patch("subprocess.run") as mock_run:
         mock_run.return_value = MagicMock(
-            stdout="https://github.com/test-owner/test-repo/pull/42\n",
+            stdout=b"https://github.com/test-owner/test-repo/pull/42\n",
             returncode=0,
         )
 
@@ -241,10 +579,209 @@ def test_get_pr_with_timestamps(adapter):
 
         pr = adapter.get_pr("42")
 
-        assert pr.merged_at is not None
+        assert pr.merged_at == datetime(2024, 2, 14, 12, 0, tzinfo=timezone.utc)
         assert pr.closed_at is not None
 
 
+def test_get_pr_reads_bytes(adapter):
+    """Test that gh output is handed to the JSON parser undecoded."""
+    import json
+
+    pr_data = {"number": 42, "title": "Tést PR", "state": "OPEN"}
+
+    with patch("subprocess.run") as mock_run:
+        mock_run.return_value = MagicMock(
+            stdout=json.dumps(pr_data, ensure_ascii=False).encode(),
+            returncode=0,
+        )
+
+        pr = adapter.get_pr("42")
+
+        assert pr.title == "Tést PR"
+        assert mock_run.call_args.kwargs["text"] is False
+
+
+def test_get_pr_failure(adapter):
+    """Test that byte stderr is decoded into the error message."""
+    import subprocess
+
+    with patch("subprocess.run") as mock_run:
+        mock_run.side_effect = subprocess.CalledProcessError(
+            returncode=1,
+            cmd=["gh", "pr", "view"],
+            stderr=b"no pull requests found",
+        )
+
+        with pytest.raises(RuntimeError, match="Failed to get PR 42: no pull"):
+            adapter.get_pr("42")
+
+
+def test_get_pr_cached(adapter):
+    """Test that repeated get_pr calls are served from cache until a write."""
+    import json
+
+    pr_data = {"number": 42, "title": "Test PR", "state": "OPEN"}
+
+    with patch("subprocess.run") as mock_run:
+        mock_run.return_value = MagicMock(stdout=json.dumps(pr_data), returncode=0)
+
+        first = adapter.get_pr("42")
+        second = adapter.get_pr("42")
+
+        assert first is second
+        assert mock_run.call_count == 1
+
+        adapter.add_pr_comment("42", "LGTM")
+        adapter.get_pr("42")
+
+        assert mock_run.call_count == 3
+
+
+def test_merge_pr_evicts_after_write(adapter):
+    """Test that a PR cached while a merge is in flight is dropped."""
+    pr_data = {"number": 42, "title": "Test PR", "state": "OPEN"}
+
+    def merge_with_racing_read(args, **kwargs):
+        adapter._cache_pr(adapter._pr_from_data(pr_data))
+        return MagicMock(returncode=0)
+
+    with patch.object(adapter, "_gh", side_effect=merge_with_racing_read):
+        adapter.merge_pr("42")
+
+    assert "42" not in adapter._pr_cache
+
+
+def test_get_pr_cache_disabled():
+    """Test that a zero TTL always hits gh."""
+    import json
+
+    pr_data = {"number": 42, "title": "Test PR", "state": "OPEN"}
+
+    with patch("subprocess.run") as mock_run:
+        adapter = GitHubRepoAdapter(
+            repo_root="/tmp/test", owner="o", name="r", pr_cache_ttl=0
+        )
+        mock_run.return_value = MagicMock(stdout=json.dumps(pr_data), returncode=0)
+
+        adapter.get_pr("42")
+        adapter.get_pr("42")
+
+        assert mock_run.call_count == 2
+
+
+def _graphql_variables(args):
+    """Collect the -f fields passed to gh api graphql."""
+    fields = [args[i + 1] for i, arg in enumerate(args) if arg == "-f"]
+    return dict(field.split("=", 1) for field in fields)
+
+
+def test_create_prs(adapter):
+    """Test creating several PRs with one aliased mutation."""
+    import json
+
+    repo_response = {"data": {"repository": {"id": "R_1"}}}
+    mutation_response = {
+        "data": {
+            "pr0": {"pullRequest": {"number": 10}},
+            "pr1": {"pullRequest": {"number": 11}},
+        }
+    }
+
+    with patch("subprocess.run") as mock_run:
+        mock_run.side_effect = [
+            MagicMock(stdout=json.dumps(repo_response), returncode=0),
+            MagicMock(stdout=json.dumps(mutation_response), returncode=0),
+        ]
+
+        pr_ids = adapter.create_prs(
+            [
+                PRCreateSpec(title="One", body="First", head="feature-1"),
+                PRCreateSpec(title="Two", body="Second", head="feature-2", base="dev"),
+            ]
+        )
+
+        assert pr_ids == ["10", "11"]
+        assert mock_run.call_count == 2
+        variables = _graphql_variables(mock_run.call_args[0][0])
+        assert variables["query"].startswith("mutation(")
+        assert "pr1: createPullRequest" in variables["query"]
+        assert variables["repo"] == "R_1"
+        assert variables["body1"] == "Second"
+        assert variables["base1"] == "dev"
+
+
+def test_create_prs_partial_failure(adapter):
+    """Test that a partly failed batch reports which PRs were created."""
+    import json
+    import subprocess
+
+    adapter._repo_node_id = "R_1"
+    partial_response = {
+        "data": {"pr0": {"pullRequest": {"number": 10}}, "pr1": None},
+        "errors": [{"path": ["pr1"], "message": "A pull request already exists"}],
+    }
+
+    with patch("subprocess.run") as mock_run:
+        mock_run.side_effect = subprocess.CalledProcessError(
+            returncode=1,
+            cmd=["gh", "api", "graphql"],
+            output=json.dumps(partial_response).encode(),
+            stderr=b"gh: A pull request already exists",
+        )
+
+        with pytest.raises(BatchError, match="succeeded: 10") as excinfo:
+            adapter.create_prs(
+                [
+                    PRCreateSpec(title="One", body="First", head="feature-1"),
+                    PRCreateSpec(title="Two", body="Second", head="feature-2"),
+                ]
+            )
+
+        assert excinfo.value.results == ["10", None]
+
+
+def test_merge_prs(adapter):
+    """Test merging several PRs with one lookup and one mutation."""
+    import json
+
+    lookup_response = {
+        "data": {"repository": {"pr0": {"id": "PR_a"}, "pr1": {"id": "PR_b"}}}
+    }
+    merge_response = {
+        "data": {
+            "pr0": {"pullRequest": {"number": 5}},
+            "pr1": {"pullRequest": {"number": 6}},
+        }
+    }
+
+    with patch("subprocess.run") as mock_run:
+        mock_run.side_effect = [
+            MagicMock(stdout=json.dumps(lookup_response), returncode=0),
+            MagicMock(stdout=json.dumps(merge_response), returncode=0),
+        ]
+
+        adapter.merge_prs(["5", "6"])
+
+        assert mock_run.call_count == 2
+        variables = _graphql_variables(mock_run.call_args[0][0])
+        assert "mergeMethod: MERGE" in variables["query"]
+        assert variables["id0"] == "PR_a"
+        assert variables["id1"] == "PR_b"
+
+
+def test_merge_prs_failure(adapter):
+    """Test that a failed batch merge raises RuntimeError."""
+    import subprocess
+
+    with patch("subprocess.run") as mock_run:
+        mock_run.side_effect = subprocess.CalledProcessError(
+            returncode=1, cmd=["gh", "api", "graphql"], stderr=b"forbidden"
+        )
+
+        with pytest.raises(RuntimeError, match="Failed to merge PRs 5, 6: forbidden"):
+            adapter.merge_prs(["5", "6"])
+
+
 def test_merge_pr(adapter):
     """Test PR merge."""
     with patch("subprocess.run") as mock_run:
@@ -270,20 +807,28 @@ def test_add_pr_comment(adapter):
         args = mock_run.call_args[0][0]
         assert "gh" in args[0]
         assert "api" in args[1]
+        assert "--include" in args
+
+
+def _git_log_process(mock_popen, stdout=b"", stderr=b"", returncode=0):
+    """Configure a patched Popen to stream git log output."""
+    proc = mock_popen.return_value.__enter__.return_value
+    proc.stdout = io.BytesIO(stdout)
+    proc.stderr = io.BytesIO(stderr)
+    proc.wait.return_value = returncode
+    proc.returncode = returncode
+    return proc
 
 
 def test_get_log(adapter):
     """Test getting commit log."""
     git_log_output = (
-        "abc123|||John Doe|||2024-02-14 12:00:00 +0000|||First commit\n"
-        "def456|||Jane Smith|||2024-02-14 11:00:00 +0000|||Second commit\n"
+        b"abc123\0John Doe\x002024-02-14 12:00:00 +0000\0First commit\0"
+        b"def456\0Jane Smith\x002024-02-14 11:00:00 +0000\0Second commit\0"
     )
 
-    with patch("subprocess.run") as mock_run:
-        mock_run.return_value = MagicMock(
-            stdout=git_log_output,
-            returncode=0,
-        )
+    with patch("subprocess.Popen") as mock_popen:
+        _git_log_process(mock_popen, git_log_output)
 
         commits = adapter.get_log(limit=10)
 
@@ -299,15 +844,13 @@ def test_get_log_with_filters(adapter):
     """Test getting commit log with filters."""
     since = datetime(2024, 2, 1)
 
-    with patch("subprocess.run") as mock_run:
-        mock_run.return_value = MagicMock(
-            stdout="",
-            returncode=0,
-        )
+    with patch("subprocess.Popen") as mock_popen:
+        _git_log_process(mock_popen)
 
         adapter.get_log(since=since, branch="feature-branch", limit=20)
 
-        args = mock_run.call_args[0][0]
+        args = mock_popen.call_args[0][0]
+        assert "-z" in args
         assert "--since=" in " ".join(args)
         assert "feature-branch" in args
         assert "-20" in args
@@ -315,11 +858,8 @@ def test_get_log_with_filters(adapter):
 
 def test_get_log_parsing_error(adapter):
     """Test handling of malformed git log output."""
-    with patch("subprocess.run") as mock_run:
-        mock_run.return_value = MagicMock(
-            stdout="malformed|||output\n",
-            returncode=0,
-        )
+    with patch("subprocess.Popen") as mock_popen:
+        _git_log_process(mock_popen, b"malformed\0output\0")
 
         commits = adapter.get_log()
 
@@ -327,6 +867,67 @@ def test_get_log_parsing_error(adapter):
         assert len(commits) == 0
 
 
+def test_get_log_special_subjects(adapter):
+    """Test subjects with separator-like text and empty subjects."""
+    with patch("subprocess.Popen") as mock_popen:
+        _git_log_process(
+            mock_popen,
+            b"abc123\0John Doe\x002024-02-14 12:00:00 +0000\0Use ||| here\0"
+            b"def456\0Jane Smith\x002024-02-14 11:00:00 +0000\0\0"
+            b"fed789\0Jane Smith\x002024-02-14 10:00:00 +0000\0Last\0",
+        )
+
+        commits = adapter.get_log()
+
+        assert [commit.message for commit in commits] == ["Use ||| here", "", "Last"]
+        assert commits[2].sha == "fed789"
+
+
+def test_get_log_failure(adapter):
+    """Test that a failing git log raises RuntimeError."""
+    with patch("subprocess.Popen") as mock_popen:
+        _git_log_process(
+            mock_popen, stderr=b"fatal: bad revision 'nope'", returncode=128
+        )
+
+        with pytest.raises(RuntimeError, match="bad revision"):
+            adapter.get_log(branch="nope")
+
+
+def test_get_logs(adapter):
+    """Test reading logs for several branches in parallel."""
+
+    def fake_get_log(*, branch, since, limit):
+        return [
+            CommitInfo(
+                sha=f"{branch}-sha",
+                message="commit",
+                author="John Doe",
+                timestamp=datetime(2024, 2, 14, tzinfo=timezone.utc),
+                branch=branch,
+            )
+        ]
+
+    with patch.object(adapter, "get_log", side_effect=fake_get_log) as mock_get_log:
+        logs = adapter.get_logs(["main", "feature", "main"], limit=5)
+
+        assert list(logs) == ["main", "feature"]
+        assert logs["feature"][0].sha == "feature-sha"
+        assert mock_get_log.call_count == 2
+        mock_get_log.assert_any_call(branch="main", since=None, limit=5)
+
+
+def test_get_logs_failure(adapter):
+    """Test that a failing branch log propagates."""
+    with patch.object(
+        adapter, "get_log", side_effect=RuntimeError("Failed to get git log: bad")
+    ):
+        with pytest.raises(RuntimeError, match="Failed to get git log"):
+            adapter.get_logs(["missing"])
+
+    assert adapter.get_logs([]) == {}
+
+
 def test_error_handling_git_failure(adapter):
     """Test error handling for git command failures."""
     with patch("subprocess.run") as mock_run:
@@ -359,3 +960,205 @@ def test_error_handling_gh_failure(adapter):
                 body="Test",
                 head="feature",
             )
+
+
+def _fake_process(stdout=b"", stderr=b"", returncode=0):
+    """Build a stand-in for an asyncio subprocess."""
+    proc = MagicMock(returncode=returncode)
+    proc.communicate = AsyncMock(return_value=(stdout, stderr))
+    return proc
+
+
+def test_aget_prs(adapter):
+    """Test fetching several PRs with one async GraphQL query."""
+    import asyncio
+    import json
+
+    response = {
+        "data": {
+            "repository": {
+                "pr0": {"number": 1, "title": "PR 1", "state": "OPEN"},
+                "pr1": {"number": 2, "title": "PR 2", "state": "OPEN"},
+            }
+        }
+    }
+
+    with patch("asyncio.create_subprocess_exec", new_callable=AsyncMock) as mock_exec:
+        mock_exec.return_value = _fake_process(json.dumps(response).encode())
+
+        prs = asyncio.run(adapter.aget_prs(["1", "2"]))
+
+        assert [pr.id for pr in prs] == ["1", "2"]
+        mock_exec.assert_called_once()
+        assert mock_exec.call_args[0][:3] == (_GH, "api", "graphql")
+
+
+def test_get_prs_graphql(adapter):
+    """Test fetching several PRs with a single GraphQL query."""
+    import json
+
+    response = {
+        "data": {
+            "repository": {
+                "pr0": {
+                    "number": 7,
+                    "state": "MERGED",
+                    "mergedAt": "2024-02-14T12:00:00Z",
+                },
+                "pr1": {"number": 3, "state": "OPEN", "headRefName": "feature"},
+            }
+        }
+    }
+
+    with patch("subprocess.run") as mock_run:
+        mock_run.return_value = MagicMock(stdout=json.dumps(response), returncode=0)
+
+        prs = adapter.get_prs(["7", "3"])
+
+        mock_run.assert_called_once()
+        args = mock_run.call_args[0][0]
+        assert args[:3] == [_GH, "api", "graphql"]
+        assert "pr1: pullRequest(number: 3)" in args[4]
+        assert [pr.id for pr in prs] == ["7", "3"]
+        assert prs[0].status == "merged"
+        assert prs[0].merged_at is not None
+        assert prs[1].branch == "feature"
+
+
+def test_get_prs_missing(adapter):
+    """Test that a PR missing from the GraphQL response raises."""
+    import json
+
+    response = {"data": {"repository": {"pr0": None}}}
+
+    with patch("subprocess.run") as mock_run:
+        mock_run.return_value = MagicMock(stdout=json.dumps(response), returncode=0)
+
+        with pytest.raises(RuntimeError, match="Failed to get PR 999"):
+            adapter.get_prs(["999"])
+
+
+def test_amerge_pr_failure(adapter):
+    """Test async merge surfaces gh failures as RuntimeError."""
+    import asyncio
+
+    with patch("asyncio.create_subprocess_exec", new_callable=AsyncMock) as mock_exec:
+        mock_exec.return_value = _fake_process(stderr=b"not mergeable", returncode=1)
+
+        with pytest.raises(RuntimeError, match="Failed to merge PR 42: not mergeable"):
+            asyncio.run(adapter.amerge_pr("42"))
+
+
+@pytest.fixture
+def http_adapter():
+    """Create an adapter whose REST calls are served by a handler list."""
+    httpx = pytest.importorskip("httpx")
+    requests = []
+    responses = []
+
+    def handler(request):
+        requests.append(request)
+        return responses.pop(0)
+
+    adapter = GitHubRepoAdapter(
+        repo_root="/tmp/test-repo",
+        owner="test-owner",
+        name="test-repo",
+        rate_limiter=RateLimiter(min_interval=0, sleep=lambda seconds: None),
+    )
+    adapter._token = "test-token"
+    adapter._http = httpx.Client(
+        base_url="https://api.github.com", transport=httpx.MockTransport(handler)
+    )
+    yield adapter, requests, responses
+    adapter.close()
+
+
+def test_http_client_created_lazily(monkeypatch):
+    """Test that a token alone does not build the HTTP client."""
+    pytest.importorskip("httpx")
+    monkeypatch.setenv("GH_TOKEN", "test-token")
+
+    with patch("herd_repo_github.adapter._http_client") as mock_client:
+        adapter = GitHubRepoAdapter(
+            repo_root="/tmp/test-repo", owner="test-owner", name="test-repo"
+        )
+        mock_client.assert_not_called()
+
+        adapter._api("GET", "/repos/test-owner/test-repo/pulls/42", mutative=False)
+        adapter._api("GET", "/repos/test-owner/test-repo/pulls/43", mutative=False)
+
+        mock_client.assert_called_once_with("test-token")
+
+
+def test_get_pr_http(http_adapter):
+    """Test fetching a PR straight from the REST API."""
+    import httpx
+
+    adapter, requests, responses = http_adapter
+    responses.append(
+        httpx.Response(
+            200,
+            json={
+                "number": 42,
+                "title": "Test PR",
+                "state": "closed",
+                "head": {"ref": "feature-branch"},
+                "base": {"ref": "main"},
+                "html_url": "https://github.com/test-owner/test-repo/pull/42",
+                "additions": 10,
+                "deletions": 5,
+                "changed_files": 2,
+                "merged_at": "2024-02-14T12:00:00Z",
+                "closed_at": "2024-02-14T12:00:00Z",
+            },
+        )
+    )
+
+    with patch("subprocess.run") as mock_run:
+        pr = adapter.get_pr("42")
+
+        mock_run.assert_not_called()
+
+    assert requests[0].url.path == "/repos/test-owner/test-repo/pulls/42"
+    assert pr.status == "merged"
+    assert pr.branch == "feature-branch"
+    assert pr.files_changed == 2
+
+
+def test_add_pr_comment_http_retries_rate_limit(http_adapter):
+    """Test that a secondary rate limit response is retried."""
+    import json
+
+    import httpx
+
+    adapter, requests, responses = http_adapter
+    responses += [
+        httpx.Response(
+            403,
+            headers={"retry-after": "1"},
+            json={"message": "You have exceeded a secondary rate limit"},
+        ),
+        httpx.Response(201, headers={"x-ratelimit-remaining": "4321"}, json={}),
+    ]
+
+    adapter.add_pr_comment("42", "LGTM")
+
+    assert len(requests) == 2
+    assert requests[1].method == "POST"
+    assert requests[1].url.path == "/repos/test-owner/test-repo/issues/42/comments"
+    assert json.loads(requests[1].content) == {"body": "LGTM"}
+    assert adapter._rate_limiter.remaining["core"] == 4321
+
+
+def test_merge_pr_http_failure(http_adapter):
+    """Test that REST merge failures surface as RuntimeError."""
+    import httpx
+
+    adapter, requests, responses = http_adapter
+    responses.append(httpx.Response(405, json={"message": "Not mergeable"}))
+
+    with pytest.raises(RuntimeError, match="Failed to merge PR 42"):
+        adapter.merge_pr("42")
+
+    assert requests[0].method == "PUT"
@@ -0,0 +1,246 @@
+"""Tests for RateLimiter."""
+
+import asyncio
+import subprocess
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from herd_repo_github import RateLimiter
+from herd_repo_github.rate_limit import parse_headers
+
+
+class FakeClock:
+    """Deterministic clock whose sleep advances time instantly."""
+
+    def __init__(self, now=1_700_000_000.0):
+        self.now = now
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def _rate_limited(stdout="", stderr=""):
+    return subprocess.CalledProcessError(
+        returncode=1, cmd=["gh", "api"], output=stdout, stderr=stderr
+    )
+
+
+def test_parse_headers():
+    """Test header parsing from gh api --include output."""
+    output = (
+        "HTTP/2.0 201 Created\n"
+        "X-Ratelimit-Remaining: 4999\n"
+        "X-Ratelimit-Reset: 1700000600\n"
+        "\n"
+        '{"id": 1}'
+    )
+
+    headers = parse_headers(output)
+
+    assert headers["x-ratelimit-remaining"] == "4999"
+    assert headers["x-ratelimit-reset"] == "1700000600"
+    assert parse_headers('{"id": 1}') == {}
+
+
+def test_submit_records_headers(clock):
+    """Test that successful responses update remaining/reset."""
+    limiter = RateLimiter(clock=clock, sleep=clock.sleep)
+    result = subprocess.CompletedProcess(
+        args=["gh"],
+        returncode=0,
+        stdout="HTTP/2.0 201 Created\nX-Ratelimit-Remaining: 12\n\n{}",
+    )
+
+    assert limiter.submit(lambda: result) is result
+    assert limiter.remaining == {"core": 12}
+
+
+def test_submit_skips_decoding_body(clock):
+    """Test that output without headers is not decoded."""
+    limiter = RateLimiter(clock=clock, sleep=clock.sleep)
+    result = subprocess.CompletedProcess(args=["gh"], returncode=0, stdout=b"{}")
+
+    with patch("herd_repo_github.rate_limit.decode_output") as mock_decode:
+        limiter.submit(lambda: result)
+
+    mock_decode.assert_not_called()
+
+
+def test_mutative_calls_are_spaced(clock):
+    """Test the minimum gap between mutative calls."""
+    limiter = RateLimiter(min_interval=1.0, clock=clock, sleep=clock.sleep)
+
+    limiter.submit(lambda: None)
+    limiter.submit(lambda: None)
+    limiter.submit(lambda: None, mutative=False)
+
+    assert clock.sleeps == [1.0]
+
+
+def test_retry_after_secondary_rate_limit(clock):
+    """Test backoff and retry when GitHub asks to retry later."""
+    limiter = RateLimiter(min_interval=0, clock=clock, sleep=clock.sleep)
+    calls = []
+
+    def fn():
+        calls.append(clock.now)
+        if len(calls) == 1:
+            raise _rate_limited(
+                stdout="HTTP/2.0 403 Forbidden\nRetry-After: 30\n\n{}",
+                stderr="gh: You have exceeded a secondary rate limit (HTTP 403)",
+            )
+        return "ok"
+
+    assert limiter.submit(fn) == "ok"
+    assert len(calls) == 2
+    assert calls[1] - calls[0] == 30
+
+
+def test_exponential_backoff_gives_up(clock):
+    """Test that retries stop after max_retries."""
+    limiter = RateLimiter(
+        min_interval=0, max_retries=2, backoff_base=1.0, clock=clock, sleep=clock.sleep
+    )
+
+    def fn():
+        raise _rate_limited(stderr="HTTP 429: Too Many Requests")
+
+    with pytest.raises(subprocess.CalledProcessError):
+        limiter.submit(fn)
+
+    assert clock.sleeps == [1.0, 2.0]
+
+
+def test_other_errors_not_retried(clock):
+    """Test that non rate-limit failures propagate immediately."""
+    limiter = RateLimiter(clock=clock, sleep=clock.sleep)
+    calls = []
+
+    def fn():
+        calls.append(1)
+        raise _rate_limited(stderr="HTTP 404: Not Found")
+
+    with pytest.raises(subprocess.CalledProcessError):
+        limiter.submit(fn)
+
+    assert len(calls) == 1
+
+
+def test_waits_for_reset_when_exhausted(clock):
+    """Test that reads wait for the window reset once the quota is spent."""
+    limiter = RateLimiter(clock=clock, sleep=clock.sleep)
+    limiter.update(
+        {"x-ratelimit-remaining": "0", "x-ratelimit-reset": str(clock.now + 30)}
+    )
+
+    limiter.submit(lambda: None, mutative=False)
+
+    assert clock.sleeps == [30]
+
+
+def test_distant_reset_raises(clock):
+    """Test that a reset beyond backoff_max fails instead of blocking."""
+    limiter = RateLimiter(backoff_max=60, clock=clock, sleep=clock.sleep)
+    limiter.update(
+        {"x-ratelimit-remaining": "0", "x-ratelimit-reset": str(clock.now + 3600)}
+    )
+
+    with pytest.raises(RuntimeError, match="core rate limit exhausted until"):
+        limiter.submit(lambda: None, mutative=False)
+    with pytest.raises(RuntimeError, match="core rate limit exhausted until"):
+        limiter.submit(lambda: None)
+
+    assert clock.sleeps == []
+    assert not limiter._busy
+
+
+def test_limits_tracked_per_resource(clock):
+    """Test that an exhausted REST quota does not hold up GraphQL calls."""
+    limiter = RateLimiter(clock=clock, sleep=clock.sleep)
+    limiter.update(
+        {
+            "x-ratelimit-resource": "core",
+            "x-ratelimit-remaining": "0",
+            "x-ratelimit-reset": str(clock.now + 30),
+        }
+    )
+
+    limiter.submit(lambda: None, mutative=False, resource="graphql")
+    assert clock.sleeps == []
+
+    limiter.submit(lambda: None, mutative=False, resource="core")
+    assert clock.sleeps == [30]
+
+
+def test_priority_order():
+    """Test that queued merges run before queued comments."""
+    limiter = RateLimiter(min_interval=0)
+    order = []
+
+    limiter._acquire("default")
+    threads = [
+        threading.Thread(
+            target=limiter.submit,
+            args=(lambda p=priority: order.append(p),),
+            kwargs={"priority": priority},
+        )
+        for priority in ("comment", "merge")
+    ]
+    for thread in threads:
+        thread.start()
+        while len(limiter._queue) < threads.index(thread) + 1:
+            time.sleep(0.001)
+
+    limiter._release()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert order == ["merge", "comment"]
+
+
+def test_interrupted_acquire_releases_slot(clock):
+    """Test that an interrupt during the spacing wait frees the slot."""
+
+    def interrupt(seconds):
+        raise KeyboardInterrupt
+
+    limiter = RateLimiter(min_interval=1.0, clock=clock, sleep=interrupt)
+    limiter.submit(lambda: None)
+
+    with pytest.raises(KeyboardInterrupt):
+        limiter.submit(lambda: None)
+
+    assert not limiter._busy
+
+
+def test_cancelled_asubmit_releases_slot():
+    """Test that cancelling a queued async call does not block later ones."""
+    limiter = RateLimiter(min_interval=0.2)
+
+    async def noop():
+        return "ok"
+
+    async def scenario():
+        await limiter.asubmit(noop)
+        task = asyncio.create_task(limiter.asubmit(noop))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        return await asyncio.wait_for(limiter.asubmit(noop), timeout=5)
+
+    assert asyncio.run(scenario()) == "ok"
+    assert not limiter._busy